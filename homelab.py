@@ -6,41 +6,135 @@ homelab monitoring system
 Entry point for the homelab application.
 """
 
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, render_template, request
+from functools import wraps
+from hashlib import blake2b
+import importlib
+import json
 import os
-import sys
-from pathlib import Path
-
-# Add modules directory to path
-sys.path.insert(0, str(Path(__file__).parent / "modules"))
-
-# Import your modules here
-from core import get_status
-from utils import get_timestamp
-from system_monitor import (
-    get_cpu_info, 
-    get_memory_info, 
-    get_disk_info, 
-    get_top_processes, 
-    get_system_overview,
-    get_educational_context
-)
-from service_discovery import (
-    get_systemd_services,
-    get_service_categories,
-    get_critical_services
-)
+import time
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to the stdlib encoder
+    orjson = None
+
+# Import your modules here - always as modules.<name>, the path the tests and
+# the legacy suite use, so each module (and its caches and sampler) loads once
+from modules.core import get_status
+from modules.utils import get_timestamp, single_flight
+
+def _lazy(module_name: str, attr: str):
+    """Defer importing a collector until its first call, so /health and page routes never load psutil"""
+    resolved = []
+    
+    def proxy(*args, **kwargs):
+        if not resolved:
+            resolved.append(getattr(importlib.import_module(module_name), attr))
+        return resolved[0](*args, **kwargs)
+    
+    proxy.__name__ = attr
+    return proxy
+
+get_cpu_info = _lazy('modules.system_monitor', 'get_cpu_info')
+get_memory_info = _lazy('modules.system_monitor', 'get_memory_info')
+get_disk_info = _lazy('modules.system_monitor', 'get_disk_info')
+get_top_processes = _lazy('modules.system_monitor', 'get_top_processes')
+get_system_overview = _lazy('modules.system_monitor', 'get_system_overview')
+get_educational_context = _lazy('modules.system_monitor', 'get_educational_context')
+get_systemd_services = _lazy('modules.service_discovery', 'get_systemd_services')
+get_service_categories = _lazy('modules.service_discovery', 'get_service_categories')
+get_critical_services = _lazy('modules.service_discovery', 'get_critical_services')
 
 app = Flask(__name__)
+# Enables test-only routes such as /api/_batch (also on when running with DEBUG=true)
+app.config['TESTING'] = os.getenv('TESTING', 'False').lower() == 'true'
+
+def _json_default(obj):
+    """Serialize NamedTuple rows (e.g. ServiceInfo) as JSON objects"""
+    if hasattr(obj, '_asdict'):
+        return obj._asdict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _to_plain(obj):
+    """Expand NamedTuples for the stdlib encoder, which would emit them as arrays"""
+    if hasattr(obj, '_asdict'):
+        return {k: _to_plain(v) for k, v in obj._asdict().items()}
+    if isinstance(obj, dict):
+        return {k: _to_plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(v) for v in obj]
+    return obj
+
+def _dumps(obj) -> bytes:
+    """Encode obj as JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(_to_plain(obj)).encode()
+
+def fast_json(obj, status: int = 200) -> Response:
+    """Build a JSON response without going through Flask's pure-Python jsonify"""
+    return Response(_dumps(obj), status=status, mimetype='application/json')
+
+# Last successful body per endpoint as (etag, body, expires_at); polling
+# dashboards within max_age share one computation and can revalidate via ETag
+_ENDPOINT_CACHE = {}
+
+def http_cached(max_age: int = 1, stale_while_revalidate: int = 2):
+    """Serve a JSON view with Cache-Control/ETag headers, answering matching If-None-Match with 304"""
+    cache_control = f'max-age={max_age}, stale-while-revalidate={stale_while_revalidate}'
+    
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            entry = _ENDPOINT_CACHE.get(view.__name__)
+            if entry is None or entry[2] <= now:
+                response = view(*args, **kwargs)
+                # Errors are never cached so the next poll retries immediately
+                if response.status_code != 200:
+                    return response
+                body = response.get_data()
+                entry = (blake2b(body, digest_size=8).hexdigest(), body, now + max_age)
+                _ENDPOINT_CACHE[view.__name__] = entry
+            
+            etag, body, _expires_at = entry
+            headers = {'Cache-Control': cache_control, 'ETag': f'"{etag}"'}
+            if request.if_none_match.contains(etag):
+                return Response(status=304, headers=headers)
+            return Response(body, mimetype='application/json', headers=headers)
+        return wrapper
+    return decorator
+
+# Static response bodies, encoded once at import instead of on every request
+_HEALTH_BODY_PREFIX = b'{"status": "healthy", "service": "homelab", "timestamp": "'
+_HEALTH_BODY_SUFFIX = b'"}'
+
+_API_DOC_BODY = _dumps({
+    "name": "homelab API",
+    "version": "0.1.0",
+    "description": "homelab monitoring system",
+    "endpoints": [
+        {"path": "/", "method": "GET", "description": "Home page"},
+        {"path": "/health", "method": "GET", "description": "Health check"},
+        {"path": "/api", "method": "GET", "description": "API documentation"},
+        {"path": "/api/cpu", "method": "GET", "description": "CPU information and usage"},
+        {"path": "/api/memory", "method": "GET", "description": "Memory usage information"},
+        {"path": "/api/disk", "method": "GET", "description": "Disk usage information"},
+        {"path": "/api/processes", "method": "GET", "description": "Top processes information"},
+        {"path": "/api/overview", "method": "GET", "description": "Complete system overview"},
+        {"path": "/api/education", "method": "GET", "description": "Educational context for monitoring"},
+        {"path": "/api/services", "method": "GET", "description": "All systemd services with status"},
+        {"path": "/api/services/categories", "method": "GET", "description": "Services organized by functional categories"},
+        {"path": "/api/services/critical", "method": "GET", "description": "Critical system services status"}
+    ]
+})
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "homelab",
-        "timestamp": get_timestamp()
-    })
+    body = _HEALTH_BODY_PREFIX + get_timestamp().encode() + _HEALTH_BODY_SUFFIX
+    return Response(body, mimetype='application/json')
 
 @app.route('/')
 def home():
@@ -61,186 +155,196 @@ def services_page():
 def api_docs():
     """API documentation endpoint - return JSON for API or render template for web"""
     # Check if request is from a browser (Accept header includes text/html)
-    from flask import request
     if 'text/html' in request.headers.get('Accept', ''):
         return render_template('dashboard.html')
     
-    return jsonify({
-        "name": "homelab API",
-        "version": "0.1.0",
-        "description": "homelab monitoring system",
-        "endpoints": [
-            {"path": "/", "method": "GET", "description": "Home page"},
-            {"path": "/health", "method": "GET", "description": "Health check"},
-            {"path": "/api", "method": "GET", "description": "API documentation"},
-            {"path": "/api/cpu", "method": "GET", "description": "CPU information and usage"},
-            {"path": "/api/memory", "method": "GET", "description": "Memory usage information"},
-            {"path": "/api/disk", "method": "GET", "description": "Disk usage information"},
-            {"path": "/api/processes", "method": "GET", "description": "Top processes information"},
-            {"path": "/api/overview", "method": "GET", "description": "Complete system overview"},
-            {"path": "/api/education", "method": "GET", "description": "Educational context for monitoring"},
-            {"path": "/api/services", "method": "GET", "description": "All systemd services with status"},
-            {"path": "/api/services/categories", "method": "GET", "description": "Services organized by functional categories"},
-            {"path": "/api/services/critical", "method": "GET", "description": "Critical system services status"}
-        ]
-    })
+    return Response(
+        _API_DOC_BODY,
+        mimetype='application/json',
+        headers={'Cache-Control': 'public, max-age=3600'}
+    )
 
 # System Monitoring API Endpoints
 
 @app.route('/api/cpu')
+@http_cached()
 def api_cpu():
     """Get CPU information and usage"""
     try:
         cpu_data = get_cpu_info()
-        return jsonify({
+        return fast_json({
             "success": True,
             "data": cpu_data,
             "educational_note": "CPU usage shows processor activity. High sustained usage may indicate system stress."
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve CPU information"
-        }), 500
+        }, 500)
 
 @app.route('/api/memory')
+@http_cached()
 def api_memory():
     """Get memory usage information"""
     try:
         memory_data = get_memory_info()
-        return jsonify({
+        return fast_json({
             "success": True,
             "data": memory_data,
             "educational_note": "Memory usage shows RAM consumption. High usage forces system to use slower disk swap."
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve memory information"
-        }), 500
+        }, 500)
 
 @app.route('/api/disk')
+@http_cached()
 def api_disk():
     """Get disk usage information"""
     try:
         disk_data = get_disk_info()
-        return jsonify({
+        return fast_json({
             "success": True,
             "data": disk_data,
             "educational_note": "Disk usage monitoring prevents system failures from full storage devices."
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve disk information"
-        }), 500
+        }, 500)
 
 @app.route('/api/processes')
+@http_cached()
 def api_processes():
     """Get top processes information"""
     try:
-        process_data = get_top_processes(limit=10)
-        return jsonify({
+        process_data = single_flight('processes', lambda: get_top_processes(limit=10))
+        return fast_json({
             "success": True,
             "data": process_data,
             "educational_note": "Process monitoring helps identify what's using system resources and troubleshoot performance issues."
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve process information"
-        }), 500
+        }, 500)
 
 @app.route('/api/overview')
+@http_cached()
 def api_overview():
     """Get comprehensive system overview"""
     try:
         overview_data = get_system_overview()
-        return jsonify({
+        return fast_json({
             "success": True,
             "data": overview_data,
             "educational_note": "System overview provides holistic view of homelab health for comprehensive monitoring."
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve system overview"
-        }), 500
+        }, 500)
 
 @app.route('/api/education')
 def api_education():
     """Get educational context for monitoring concepts"""
     try:
         education_data = get_educational_context()
-        return jsonify({
+        return fast_json({
             "success": True,
             "data": education_data,
             "message": "Educational explanations for system monitoring concepts"
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve educational context"
-        }), 500
+        }, 500)
 
 # Service Discovery API Endpoints
 
 @app.route('/api/services')
+@http_cached()
 def api_services():
     """Get all systemd services with status and educational context"""
     try:
-        services_data = get_systemd_services()
-        return jsonify({
+        services_data = single_flight('services', get_systemd_services)
+        return fast_json({
             "success": True,
             "data": services_data,
             "educational_note": "systemd services are background programs that provide system functionality. Monitor them to understand your system."
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve systemd services"
-        }), 500
+        }, 500)
 
 @app.route('/api/services/categories')
+@http_cached()
 def api_services_categories():
     """Get services organized by functional categories"""
     try:
-        categories_data = get_service_categories()
-        return jsonify({
+        categories_data = single_flight('service_categories', get_service_categories)
+        return fast_json({
             "success": True,
             "data": categories_data,
             "educational_note": "Categorizing services helps understand different system functions and their dependencies."
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve service categories"
-        }), 500
+        }, 500)
 
 @app.route('/api/services/critical')
+@http_cached()
 def api_services_critical():
     """Get critical system services that should always be running"""
     try:
-        critical_data = get_critical_services()
-        return jsonify({
+        critical_data = single_flight('critical_services', get_critical_services)
+        return fast_json({
             "success": True,
             "data": critical_data,
             "educational_note": "Critical services are essential for basic system operation. Monitor them closely for system health."
         })
     except Exception as e:
-        return jsonify({
+        return fast_json({
             "success": False,
             "error": str(e),
             "message": "Failed to retrieve critical services"
-        }), 500
+        }, 500)
+
+@app.route('/api/_batch', methods=['POST'])
+def api_batch():
+    """Test-only: GET several local endpoints in one round trip, returning {path: {status, body}}"""
+    if not (app.debug or app.testing):
+        return fast_json({"success": False, "error": "Not found"}, 404)
+    
+    paths = request.get_json(silent=True)
+    if not isinstance(paths, list) or not all(isinstance(p, str) and p.startswith('/') for p in paths):
+        return fast_json({"success": False, "error": "Expected a JSON list of paths"}, 400)
+    
+    client = app.test_client()
+    results = {}
+    for path in paths:
+        response = client.get(path)
+        results[path] = {"status": response.status_code, "body": response.get_json(silent=True)}
+    return fast_json(results)
 
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
@@ -250,4 +354,5 @@ if __name__ == '__main__':
     print(f"🌐 Server: http://localhost:5000")
     print(f"🔍 Health check: http://localhost:5000/health")
     
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    # Threaded so a blocking systemctl call never stalls other pollers
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
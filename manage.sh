@@ -7,6 +7,9 @@ PROJECT_NAME="homelab"
 SERVICE_NAME="homelab"
 PORT="5000"
 PYTHON_COMMAND="homelab.py"
+WSGI_APP="homelab:app"
+GUNICORN_WORKERS="${GUNICORN_WORKERS:-2}"
+GUNICORN_THREADS="${GUNICORN_THREADS:-8}"
 
 show_help() {
     echo "🚀 $PROJECT_NAME Management"
@@ -97,8 +100,14 @@ start_service() {
     fi
     
     # Start the service with the available port
+    # Prefer gunicorn (parallel workers) and fall back to the Flask dev server
     export PORT=$AVAILABLE_PORT
-    .venv/bin/python $PYTHON_COMMAND &
+    if [ -x ".venv/bin/gunicorn" ]; then
+        echo "🦄 Serving with gunicorn ($GUNICORN_WORKERS workers x $GUNICORN_THREADS threads)"
+        .venv/bin/gunicorn --workers "$GUNICORN_WORKERS" --worker-class gthread --threads "$GUNICORN_THREADS" --bind "0.0.0.0:$AVAILABLE_PORT" "$WSGI_APP" &
+    else
+        .venv/bin/python $PYTHON_COMMAND &
+    fi
     PID=$!
     echo $PID > "${SERVICE_NAME}.pid"
     
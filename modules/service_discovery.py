@@ -4,9 +4,145 @@ Discover and categorize systemd services with educational descriptions for Linux
 """
 
 import subprocess
-import json
 import re
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+try:
+    from pystemd.systemd1 import Manager as SystemdManager
+except ImportError:  # Optional: query systemd over D-Bus instead of forking systemctl
+    SystemdManager = None
+
+
+# Rows are (unit, load, active, sub, description) tuples.
+UnitRow = Tuple[str, str, str, str, str]
+
+
+class ServiceInfo(NamedTuple):
+    """One annotated systemd unit; serialized as an object via _asdict()"""
+    name: str
+    description: str
+    load_state: str
+    active_state: str
+    sub_state: str
+    category: str
+    educational_note: str
+
+
+# Parsed `systemctl` output keyed by argv, so dashboard polling within the TTL
+# window reuses one subprocess result instead of forking on every request.
+_SYSCTL_CACHE: Dict[Tuple[str, ...], Tuple[float, List[UnitRow]]] = {}
+_SYSCTL_CACHE_LOCK = threading.Lock()
+_SYSCTL_CACHE_TTL = 2.0
+# One refresh lock per argv so concurrent cache misses share a single systemctl run
+_SYSCTL_REFRESH_LOCKS: Dict[Tuple[str, ...], threading.Lock] = {}
+
+
+# Minimal child environment: C locale keeps systemctl output deterministic for
+# parsing and skips copying the whole parent environment on every fork
+_MIN_ENV = {'LANG': 'C', 'LC_ALL': 'C', 'PATH': '/usr/bin:/bin'}
+
+
+def _run_systemctl(args: List[str], check: bool = False) -> subprocess.CompletedProcess:
+    """
+    Run `systemctl <args>` and capture stdout as text.
+    
+    Python creates fds non-inheritable by default (PEP 446), so close_fds=False
+    is safe and avoids closing every possible descriptor before exec.
+    """
+    return subprocess.run(
+        ['systemctl', *args],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        env=_MIN_ENV, close_fds=False, check=check
+    )
+
+
+def _parse_unit_line(line: str) -> Optional[UnitRow]:
+    """Split one `systemctl list-units --plain --no-legend` line into its columns."""
+    fields = line.split(None, 4)
+    # Some systemd versions still prefix failed units with a status marker
+    if fields and fields[0] in ('●', '*'):
+        fields = fields[1:]
+    if len(fields) < 4:
+        return None
+    if len(fields) == 4:
+        fields.append('')
+    return tuple(fields)
+
+
+def _dbus_list_units() -> Optional[List[UnitRow]]:
+    """
+    List every loaded unit through systemd's D-Bus API in a single call.
+    
+    Returns None when pystemd is not installed or the bus is unreachable,
+    so callers can fall back to the systemctl binary.
+    """
+    if SystemdManager is None:
+        return None
+    try:
+        with SystemdManager() as manager:
+            raw_units = manager.Manager.ListUnits()
+    except Exception:  # pystemd raises its own DBus error hierarchy
+        return None
+    
+    # ListUnits rows start with (name, description, load, active, sub, ...) as bytes
+    return [
+        (name.decode(), load.decode(), active.decode(), sub.decode(), description.decode())
+        for name, description, load, active, sub, *_rest in raw_units
+    ]
+
+
+def _dbus_service_units(args: Tuple[str, ...]) -> Optional[List[UnitRow]]:
+    """Apply the `--type=service` / `--state=active` filters of args to the D-Bus unit list."""
+    units = _dbus_list_units()
+    if units is None:
+        return None
+    active_only = '--state=active' in args
+    return [
+        row for row in units
+        if row[0].endswith('.service') and (not active_only or row[2] == 'active')
+    ]
+
+
+def _cached_systemctl(args: Tuple[str, ...], ttl: float = _SYSCTL_CACHE_TTL) -> List[UnitRow]:
+    """
+    Run a `systemctl list-units` command, reusing the parsed rows for `ttl` seconds.
+    
+    Units come from the D-Bus API when pystemd is available; otherwise output is
+    read in `--plain --no-legend` text form and split into columns.
+    
+    Raises:
+        subprocess.CalledProcessError: If systemctl exits with a non-zero status
+    """
+    now = time.monotonic()
+    with _SYSCTL_CACHE_LOCK:
+        cached = _SYSCTL_CACHE.get(args)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        refresh_lock = _SYSCTL_REFRESH_LOCKS.setdefault(args, threading.Lock())
+    
+    with refresh_lock:
+        # Another thread may have refreshed while this one waited for the lock
+        with _SYSCTL_CACHE_LOCK:
+            cached = _SYSCTL_CACHE.get(args)
+        if cached is not None and cached[0] >= now:
+            return cached[1]
+        
+        units = _dbus_service_units(args)
+        if units is None:
+            result = _run_systemctl([*args[1:], '--plain', '--no-legend', '--no-pager'], check=True)
+            units = [row for row in map(_parse_unit_line, result.stdout.splitlines()) if row]
+        
+        with _SYSCTL_CACHE_LOCK:
+            _SYSCTL_CACHE[args] = (time.monotonic(), units)
+    return units
+
+
+def _fetch_all_units() -> List[UnitRow]:
+    """All service units in every state, shared by the services and categories views."""
+    return _cached_systemctl(('systemctl', 'list-units', '--type=service', '--all'))
 
 
 def get_systemd_services() -> Dict[str, Any]:
@@ -17,12 +153,8 @@ def get_systemd_services() -> Dict[str, Any]:
         dict: Services organized by status with educational context
     """
     try:
-        # Get all systemd services in JSON format
-        result = subprocess.run([
-            'systemctl', 'list-units', '--type=service', '--all', '--output=json'
-        ], capture_output=True, text=True, check=True)
-        
-        services_data = json.loads(result.stdout)
+        # Get all systemd services
+        services_data = _fetch_all_units()
         
         # Organize services by status
         services_by_status = {
@@ -32,26 +164,19 @@ def get_systemd_services() -> Dict[str, Any]:
             'masked': []
         }
         
-        for service in services_data:
-            service_info = {
-                'name': service.get('unit', ''),
-                'description': service.get('description', ''),
-                'load_state': service.get('load', ''),
-                'active_state': service.get('active', ''),
-                'sub_state': service.get('sub', ''),
-                'category': _categorize_service(service.get('unit', '')),
-                'educational_note': _get_educational_note(service.get('unit', ''))
-            }
+        for unit, load, active, sub, description in services_data:
+            # Bucket by active state via dict lookup; masked units only land in
+            # 'masked' when their active state is none of the other three
+            bucket = services_by_status.get(active) if active != 'masked' else None
+            if bucket is None:
+                if load != 'masked':
+                    continue
+                bucket = services_by_status['masked']
             
-            # Categorize by active state
-            if service_info['active_state'] == 'active':
-                services_by_status['active'].append(service_info)
-            elif service_info['active_state'] == 'inactive':
-                services_by_status['inactive'].append(service_info)
-            elif service_info['active_state'] == 'failed':
-                services_by_status['failed'].append(service_info)
-            elif service_info['load_state'] == 'masked':
-                services_by_status['masked'].append(service_info)
+            category, educational_note = _classify_service(unit.lower())
+            bucket.append(ServiceInfo(
+                unit, description, load, active, sub, category, educational_note
+            ))
         
         return {
             'services': services_by_status,
@@ -82,11 +207,8 @@ def get_service_categories() -> Dict[str, List[str]]:
         dict: Services grouped by category with descriptions
     """
     try:
-        result = subprocess.run([
-            'systemctl', 'list-units', '--type=service', '--state=active', '--output=json'
-        ], capture_output=True, text=True, check=True)
-        
-        services_data = json.loads(result.stdout)
+        # Derived from the shared all-units result so both endpoints use one cache entry
+        services_data = [row for row in _fetch_all_units() if row[2] == 'active']
         
         categories = {
             'System Core': [],
@@ -100,14 +222,13 @@ def get_service_categories() -> Dict[str, List[str]]:
             'Other': []
         }
         
-        for service in services_data:
-            service_name = service.get('unit', '')
-            category = _categorize_service(service_name)
+        for service_name, _load, _active, _sub, description in services_data:
+            category, educational_note = _classify_service(service_name.lower())
             
             service_info = {
                 'name': service_name,
-                'description': service.get('description', ''),
-                'educational_note': _get_educational_note(service_name)
+                'description': description,
+                'educational_note': educational_note
             }
             
             categories[category].append(service_info)
@@ -125,6 +246,28 @@ def get_service_categories() -> Dict[str, List[str]]:
         }
 
 
+# Static explanation attached to every critical services response
+_CRITICAL_SERVICES_CONTEXT = {
+    'what_are_critical_services': "Critical services are essential system components that enable basic functionality like networking, display management, and user sessions.",
+    'why_monitor_them': "Monitoring critical services helps identify system issues early and ensures your desktop environment remains stable and functional.",
+    'learning_objective': "Understanding which services are critical helps in system troubleshooting and maintenance planning."
+}
+
+
+def _critical_statuses(services: List[str]) -> List[str]:
+    """Active state for each service, in order, from one D-Bus call or one systemctl call."""
+    units = _dbus_list_units()
+    if units is not None:
+        # Units systemd has not loaded are reported as inactive, matching `systemctl is-active`
+        active_states = {row[0]: row[2] for row in units}
+        return [active_states.get(service, 'inactive') for service in services]
+    
+    # `systemctl is-active` accepts several units and prints one state per line,
+    # so a single subprocess covers every critical service
+    result = _run_systemctl(['is-active', *services])
+    return result.stdout.splitlines()
+
+
 def get_critical_services() -> Dict[str, Any]:
     """
     Identify critical system services that should always be running.
@@ -143,167 +286,187 @@ def get_critical_services() -> Dict[str, Any]:
         'bluetooth.service'
     ]
     
+    statuses = _critical_statuses(critical_services)
+    
     service_status = {}
     
-    for service in critical_services:
-        try:
-            result = subprocess.run([
-                'systemctl', 'is-active', service
-            ], capture_output=True, text=True)
-            
-            status = result.stdout.strip()
-            
-            service_status[service] = {
-                'status': status,
-                'is_critical': True,
-                'importance': _get_service_importance(service),
-                'troubleshooting': _get_troubleshooting_tips(service)
-            }
-            
-        except subprocess.CalledProcessError:
-            service_status[service] = {
-                'status': 'unknown',
-                'is_critical': True,
-                'importance': _get_service_importance(service),
-                'troubleshooting': _get_troubleshooting_tips(service)
-            }
+    for index, service in enumerate(critical_services):
+        status = statuses[index].strip() if index < len(statuses) else 'unknown'
+        
+        service_status[service] = {
+            'status': status,
+            'is_critical': True,
+            'importance': _get_service_importance(service),
+            'troubleshooting': _get_troubleshooting_tips(service)
+        }
     
     return {
         'critical_services': service_status,
-        'educational_context': {
-            'what_are_critical_services': "Critical services are essential system components that enable basic functionality like networking, display management, and user sessions.",
-            'why_monitor_them': "Monitoring critical services helps identify system issues early and ensures your desktop environment remains stable and functional.",
-            'learning_objective': "Understanding which services are critical helps in system troubleshooting and maintenance planning."
-        }
+        'educational_context': _CRITICAL_SERVICES_CONTEXT
     }
 
 
+# Category token sets, checked in priority order. Unit names are split on their
+# `-.@_` delimiters once, then each category is a single set intersection; whole
+# tokens also avoid substring false positives such as "cups" in "backups".
+_UNIT_TOKEN_RE = re.compile(r'[-.@_]')
+_CATEGORY_TOKENS = [
+    ('System Core', frozenset({
+        'systemd', 'kernel', 'kerneloops', 'udev', 'dbus', 'polkit', 'kmod'
+    })),
+    ('Network Services', frozenset({
+        'network', 'networking', 'networkmanager', 'networkd', 'wifi', 'wpa', 'iwd',
+        'bluetooth', 'ssh', 'sshd', 'vpn', 'openvpn', 'wireguard',
+        'firewall', 'firewalld', 'ufw'
+    })),
+    ('Desktop Environment', frozenset({
+        'gdm', 'gdm3', 'gnome', 'kde', 'sddm', 'lightdm', 'xorg', 'wayland', 'display'
+    })),
+    ('Security & Authentication', frozenset({
+        'auth', 'sudo', 'security', 'keyring', 'login', 'apparmor', 'auditd', 'fail2ban'
+    })),
+    ('Hardware & Drivers', frozenset({
+        'audio', 'sound', 'pulse', 'pulseaudio', 'pipewire', 'alsa',
+        'printer', 'cups', 'cupsd', 'usb', 'usbmuxd'
+    })),
+    ('User Services', frozenset({
+        'user', 'session', 'at', 'atd', 'cron', 'crond', 'cronie', 'anacron'
+    })),
+    ('Development Tools', frozenset({
+        'docker', 'containerd', 'podman', 'git', 'dev', 'build', 'compile'
+    })),
+    ('Media & Graphics', frozenset({
+        'media', 'video', 'graphics', 'camera'
+    }))
+]
+
+
 def _categorize_service(service_name: str) -> str:
     """Categorize a service based on its name and function."""
-    service_lower = service_name.lower()
-    
-    # System Core
-    if any(keyword in service_lower for keyword in ['systemd', 'kernel', 'udev', 'dbus', 'polkit']):
-        return 'System Core'
-    
-    # Network Services
-    if any(keyword in service_lower for keyword in ['network', 'wifi', 'bluetooth', 'ssh', 'vpn', 'firewall']):
-        return 'Network Services'
-    
-    # Desktop Environment
-    if any(keyword in service_lower for keyword in ['gdm', 'gnome', 'kde', 'xorg', 'wayland', 'display']):
-        return 'Desktop Environment'
-    
-    # Security & Authentication
-    if any(keyword in service_lower for keyword in ['auth', 'sudo', 'security', 'keyring', 'login']):
-        return 'Security & Authentication'
-    
-    # Hardware & Drivers
-    if any(keyword in service_lower for keyword in ['audio', 'sound', 'pulse', 'alsa', 'printer', 'cups', 'usb']):
-        return 'Hardware & Drivers'
-    
-    # User Services
-    if any(keyword in service_lower for keyword in ['user@', 'session', 'at.service', 'cron']):
-        return 'User Services'
-    
-    # Development Tools
-    if any(keyword in service_lower for keyword in ['docker', 'git', 'dev', 'build', 'compile']):
-        return 'Development Tools'
-    
-    # Media & Graphics
-    if any(keyword in service_lower for keyword in ['media', 'video', 'graphics', 'camera']):
-        return 'Media & Graphics'
+    return _category_for(service_name.lower())
+
+
+def _category_for(service_lower: str) -> str:
+    """Categorize an already-lowercased service name."""
+    tokens = set(_UNIT_TOKEN_RE.split(service_lower))
+    for category, needles in _CATEGORY_TOKENS:
+        if not needles.isdisjoint(tokens):
+            return category
     
     return 'Other'
 
 
+# Educational notes for well-known services, matched by one precompiled
+# alternation instead of a per-call dict rebuild and a loop of `in` checks
+_EDU_NOTES = {
+    'networkmanager': "Manages network connections including WiFi, Ethernet, and VPN. Essential for internet connectivity.",
+    'gdm': "GNOME Display Manager - handles user login screen and session management in GNOME desktop environments.",
+    'systemd-resolved': "Provides network name resolution (DNS) services. Converts domain names to IP addresses.",
+    'dbus': "Desktop Bus - enables communication between applications and system services. Critical for desktop functionality.",
+    'pulseaudio': "Audio server that manages sound devices and audio streams. Handles all audio input/output.",
+    'bluetooth': "Manages Bluetooth devices like wireless headphones, mice, and keyboards.",
+    'systemd-logind': "Handles user logins, sessions, and power management events like suspend/hibernate.",
+    'systemd-timesyncd': "Keeps system clock synchronized with network time servers (NTP).",
+    'cups': "Common Unix Printing System - manages printers and print jobs.",
+    'firewalld': "Dynamic firewall management tool that controls network traffic for security."
+}
+_EDU_RE = re.compile('|'.join(map(re.escape, _EDU_NOTES)))
+_DEFAULT_NOTE = "A system service that provides specific functionality. Check the description for more details."
+
+
 def _get_educational_note(service_name: str) -> str:
     """Get educational explanation for common services."""
-    service_lower = service_name.lower()
-    
-    educational_notes = {
-        'networkmanager': "Manages network connections including WiFi, Ethernet, and VPN. Essential for internet connectivity.",
-        'gdm': "GNOME Display Manager - handles user login screen and session management in GNOME desktop environments.",
-        'systemd-resolved': "Provides network name resolution (DNS) services. Converts domain names to IP addresses.",
-        'dbus': "Desktop Bus - enables communication between applications and system services. Critical for desktop functionality.",
-        'pulseaudio': "Audio server that manages sound devices and audio streams. Handles all audio input/output.",
-        'bluetooth': "Manages Bluetooth devices like wireless headphones, mice, and keyboards.",
-        'systemd-logind': "Handles user logins, sessions, and power management events like suspend/hibernate.",
-        'systemd-timesyncd': "Keeps system clock synchronized with network time servers (NTP).",
-        'cups': "Common Unix Printing System - manages printers and print jobs.",
-        'firewalld': "Dynamic firewall management tool that controls network traffic for security."
-    }
-    
-    for key, note in educational_notes.items():
-        if key in service_lower:
-            return note
-    
-    return "A system service that provides specific functionality. Check the description for more details."
+    return _note_for(service_name.lower())
+
+
+def _note_for(service_lower: str) -> str:
+    """Educational note for an already-lowercased service name."""
+    match = _EDU_RE.search(service_lower)
+    return _EDU_NOTES[match.group(0)] if match else _DEFAULT_NOTE
+
+
+# Unit names are a small, stable set between requests, so classification is memoized
+@lru_cache(maxsize=2048)
+def _classify_service(service_lower: str) -> Tuple[str, str]:
+    """Category and educational note for a lowercased name, computed together in the hot loop."""
+    return _category_for(service_lower), _note_for(service_lower)
+
+
+# Static teaching content, built once and returned by reference
+_SYSTEMD_EDUCATIONAL_CONTEXT = {
+    'what_is_systemd': "systemd is the init system and service manager for modern Linux distributions. It manages the startup and running of system services.",
+    'what_are_services': "Services are background programs that provide system functionality like networking, audio, printing, and user session management.",
+    'service_states': {
+        'active': "Service is currently running and operational",
+        'inactive': "Service is stopped but can be started when needed",
+        'failed': "Service failed to start or crashed - may need attention",
+        'masked': "Service is completely disabled and cannot be started"
+    },
+    'learning_commands': [
+        "systemctl status <service> - Check detailed status of a service",
+        "systemctl start <service> - Start a stopped service",
+        "systemctl stop <service> - Stop a running service",
+        "systemctl enable <service> - Enable service to start at boot",
+        "systemctl disable <service> - Disable service from starting at boot"
+    ]
+}
 
 
 def _get_systemd_educational_context() -> Dict[str, str]:
     """Get educational context about systemd and services."""
-    return {
-        'what_is_systemd': "systemd is the init system and service manager for modern Linux distributions. It manages the startup and running of system services.",
-        'what_are_services': "Services are background programs that provide system functionality like networking, audio, printing, and user session management.",
-        'service_states': {
-            'active': "Service is currently running and operational",
-            'inactive': "Service is stopped but can be started when needed",
-            'failed': "Service failed to start or crashed - may need attention",
-            'masked': "Service is completely disabled and cannot be started"
-        },
-        'learning_commands': [
-            "systemctl status <service> - Check detailed status of a service",
-            "systemctl start <service> - Start a stopped service",
-            "systemctl stop <service> - Stop a running service",
-            "systemctl enable <service> - Enable service to start at boot",
-            "systemctl disable <service> - Disable service from starting at boot"
-        ]
-    }
+    return _SYSTEMD_EDUCATIONAL_CONTEXT
+
+
+# Static category descriptions, built once and returned by reference
+_CATEGORY_DESCRIPTIONS = {
+    'System Core': "Essential low-level services that provide basic system functionality",
+    'Network Services': "Services that manage network connectivity, protocols, and security",
+    'Desktop Environment': "Services that provide graphical user interface and window management",
+    'Security & Authentication': "Services that handle user authentication and system security",
+    'Hardware & Drivers': "Services that manage hardware devices and drivers",
+    'User Services': "Services that run in user sessions and provide user-specific functionality",
+    'Development Tools': "Services related to software development and programming tools",
+    'Media & Graphics': "Services that handle multimedia, graphics, and audio/video processing",
+    'Other': "Miscellaneous services that don't fit into standard categories"
+}
 
 
 def _get_category_descriptions() -> Dict[str, str]:
     """Get descriptions for service categories."""
-    return {
-        'System Core': "Essential low-level services that provide basic system functionality",
-        'Network Services': "Services that manage network connectivity, protocols, and security",
-        'Desktop Environment': "Services that provide graphical user interface and window management",
-        'Security & Authentication': "Services that handle user authentication and system security",
-        'Hardware & Drivers': "Services that manage hardware devices and drivers",
-        'User Services': "Services that run in user sessions and provide user-specific functionality",
-        'Development Tools': "Services related to software development and programming tools",
-        'Media & Graphics': "Services that handle multimedia, graphics, and audio/video processing",
-        'Other': "Miscellaneous services that don't fit into standard categories"
-    }
+    return _CATEGORY_DESCRIPTIONS
+
+
+# Why each critical service matters, looked up once per service per request
+_SERVICE_IMPORTANCE = {
+    'systemd-logind.service': "Manages user sessions and power events. Without it, you can't log in or manage power states.",
+    'dbus.service': "Inter-process communication system. Many desktop applications won't work without it.",
+    'NetworkManager.service': "Manages all network connections. No internet or network access without it.",
+    'systemd-resolved.service': "DNS resolution service. Websites won't load without proper name resolution.",
+    'systemd-timesyncd.service': "Keeps system time accurate. Important for security certificates and logs.",
+    'gdm.service': "Login manager for GNOME. You can't log into the desktop without it.",
+    'pulseaudio.service': "Audio system. No sound from applications without it.",
+    'bluetooth.service': "Bluetooth device management. Wireless peripherals won't work without it."
+}
 
 
 def _get_service_importance(service_name: str) -> str:
     """Get importance explanation for critical services."""
-    importance_map = {
-        'systemd-logind.service': "Manages user sessions and power events. Without it, you can't log in or manage power states.",
-        'dbus.service': "Inter-process communication system. Many desktop applications won't work without it.",
-        'NetworkManager.service': "Manages all network connections. No internet or network access without it.",
-        'systemd-resolved.service': "DNS resolution service. Websites won't load without proper name resolution.",
-        'systemd-timesyncd.service': "Keeps system time accurate. Important for security certificates and logs.",
-        'gdm.service': "Login manager for GNOME. You can't log into the desktop without it.",
-        'pulseaudio.service': "Audio system. No sound from applications without it.",
-        'bluetooth.service': "Bluetooth device management. Wireless peripherals won't work without it."
-    }
-    
-    return importance_map.get(service_name, "Important system service that provides essential functionality.")
+    return _SERVICE_IMPORTANCE.get(service_name, "Important system service that provides essential functionality.")
+
+
+# Troubleshooting hints for critical services
+_TROUBLESHOOTING_TIPS = {
+    'systemd-logind.service': "If failed, check for conflicting display managers or permission issues.",
+    'dbus.service': "If failed, system may be severely broken. Check system logs and consider reboot.",
+    'NetworkManager.service': "If failed, check network configuration and try 'systemctl restart NetworkManager'.",
+    'systemd-resolved.service': "If failed, DNS won't work. Check /etc/systemd/resolved.conf configuration.",
+    'systemd-timesyncd.service': "If failed, time sync is broken. Check network connectivity and NTP servers.",
+    'gdm.service': "If failed, you can't access desktop. Try switching to different display manager or TTY login.",
+    'pulseaudio.service': "If failed, restart it or check audio device permissions and configuration.",
+    'bluetooth.service': "If failed, restart it or check if Bluetooth hardware is enabled in BIOS."
+}
 
 
 def _get_troubleshooting_tips(service_name: str) -> str:
     """Get troubleshooting tips for critical services."""
-    tips_map = {
-        'systemd-logind.service': "If failed, check for conflicting display managers or permission issues.",
-        'dbus.service': "If failed, system may be severely broken. Check system logs and consider reboot.",
-        'NetworkManager.service': "If failed, check network configuration and try 'systemctl restart NetworkManager'.",
-        'systemd-resolved.service': "If failed, DNS won't work. Check /etc/systemd/resolved.conf configuration.",
-        'systemd-timesyncd.service': "If failed, time sync is broken. Check network connectivity and NTP servers.",
-        'gdm.service': "If failed, you can't access desktop. Try switching to different display manager or TTY login.",
-        'pulseaudio.service': "If failed, restart it or check audio device permissions and configuration.",
-        'bluetooth.service': "If failed, restart it or check if Bluetooth hardware is enabled in BIOS."
-    }
-    
-    return tips_map.get(service_name, "Check service logs with 'journalctl -u " + service_name + "' for error details.")
+    return _TROUBLESHOOTING_TIPS.get(service_name, "Check service logs with 'journalctl -u " + service_name + "' for error details.")
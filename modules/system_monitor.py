@@ -6,12 +6,446 @@ This module provides system health data with explanations to help understand
 what's happening under the hood of your Linux system.
 """
 
+import heapq
+import os
 import psutil
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import wraps
+from typing import Dict, List, Any, Callable, NamedTuple, Optional, Tuple
 
+try:
+    import pwd
+except ImportError:  # Not available on Windows - the procfs path is never used there
+    pwd = None
 
+
+# procfs access - Linux exposes per-process data as small files under /proc
+_PROC_DIR = '/proc'
+_HAS_PROCFS = os.path.isdir(os.path.join(_PROC_DIR, 'self'))
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_PROC_READ_SIZE = 8192
+_CLK_TCK = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+_GIB = 1 << 30
+
+# Invariant for the life of the process - read once at import
+_BOOT_TIME = psutil.boot_time()
+_CPU_LOGICAL = psutil.cpu_count(logical=True)
+_CPU_PHYSICAL = psutil.cpu_count(logical=False)
+
+
+# How long collector results are reused, so bursts of dashboard polls share one
+# psutil sweep; set HOMELAB_METRICS_TTL=0 to disable
+_METRICS_TTL = float(os.getenv('HOMELAB_METRICS_TTL', '1.0'))
+
+
+def _ttl_cache(seconds: float) -> Callable:
+    """
+    Memoize a collector per call arguments for `seconds`.
+    
+    Keyword arguments starting with an underscore are treated as call options
+    rather than part of the cache key. The wrapper exposes cache_clear().
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(
+                (name, value) for name, value in kwargs.items() if not name.startswith('_')
+            )))
+            now = time.monotonic()
+            with lock:
+                cached = cache.get(key)
+                if cached is not None and now - cached[0] < seconds:
+                    return cached[1]
+            
+            value = func(*args, **kwargs)
+            with lock:
+                cache[key] = (time.monotonic(), value)
+            return value
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def _stamped(func: Callable) -> Callable:
+    """
+    Add 'timestamp' to a cached collector's result on every call.
+    
+    The cached dict carries no timestamp, so each caller gets `_now` when it
+    passes one (get_system_overview shares a single clock read) and the
+    current time otherwise, never another caller's stamp from the TTL window.
+    """
+    @wraps(func)
+    def wrapper(*args, _now: Optional[str] = None, **kwargs):
+        result = dict(func(*args, **kwargs))
+        result['timestamp'] = _now or datetime.now().isoformat()
+        return result
+    
+    wrapper.cache_clear = func.cache_clear
+    return wrapper
+
+
+# Usage descriptions as (threshold, inclusive, text) rows in descending order;
+# the first row the value passes (> threshold, or >= when inclusive) wins, and
+# the final None entry is the fallback.
+_CPU_USAGE_NOTES = (
+    (80, False, "High usage (>80%) may slow down other processes."),
+    (50, True, "Moderate usage - monitor if sustained."),
+    (None, False, "Normal usage level.")
+)
+_CPU_USAGE_TEMPLATE = "CPU is {usage}% busy. {note}"
+_MEMORY_STATUSES = (
+    (90, False, "Critical - consider closing applications or adding RAM"),
+    (80, False, "High - monitor closely"),
+    (60, False, "Moderate - normal for active homelab"),
+    (None, False, "Good - plenty of available memory")
+)
+_DISK_STATUSES = (
+    (95, False, "Critical - cleanup needed immediately"),
+    (85, False, "High - cleanup recommended"),
+    (70, False, "Moderate - monitor growth"),
+    (None, False, "Good - sufficient space")
+)
+_CORES_EXPLANATION = (
+    f"Your system has {_CPU_PHYSICAL} physical cores with {_CPU_LOGICAL} threads "
+    f"(hyperthreading: {'enabled' if _CPU_PHYSICAL and _CPU_LOGICAL > _CPU_PHYSICAL else 'disabled'})"
+)
+
+
+def _status_text(value: float, table: Tuple[Tuple[Optional[float], bool, str], ...]) -> str:
+    """Pick the description for `value` from a descending threshold table."""
+    for threshold, inclusive, text in table:
+        if threshold is None or value > threshold or (inclusive and value == threshold):
+            return text
+    return table[-1][2]
+
+
+def _fmt_gb(num_bytes: int) -> str:
+    """Byte count as GB with two decimals, for human-readable explanation text."""
+    return f'{num_bytes / _GIB:.2f}'
+
+
+def _list_pids() -> List[int]:
+    """List current PIDs from a single /proc directory scan (psutil elsewhere)."""
+    if not _HAS_PROCFS:
+        return psutil.pids()
+    with os.scandir(_PROC_DIR) as entries:
+        return [int(entry.name) for entry in entries if entry.name.isdigit()]
+
+
+def _read_proc_file(path: str) -> Optional[bytes]:
+    """
+    Read a small procfs file with a single os.read(), or None if it is gone.
+    
+    One read() call returns a consistent snapshot of live files such as
+    /proc/meminfo, and raw `os` calls avoid building a Python file object.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, _PROC_READ_SIZE)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _read_proc_batch(paths: List[str]) -> Dict[str, Optional[bytes]]:
+    """Read a batch of procfs files; files that vanish mid-sweep (exited processes) map to None."""
+    return {path: _read_proc_file(path) for path in paths}
+
+
+class _MemoryStats(NamedTuple):
+    total: int
+    used: int
+    available: int
+    percent: float
+
+
+class _SwapStats(NamedTuple):
+    total: int
+    used: int
+    percent: float
+
+
+def _usage_percent(used: int, total: int) -> float:
+    """Percentage rounded like psutil, 0.0 for an empty total."""
+    return round(used / total * 100, 1) if total else 0.0
+
+
+def _memory_stats() -> Tuple[_MemoryStats, _SwapStats]:
+    """
+    RAM and swap usage from one /proc/meminfo read (psutil's two calls parse it twice).
+    
+    Formulas follow psutil: used = total - available, swap used = total - free.
+    Falls back to psutil where procfs is unavailable.
+    """
+    data = _read_proc_file(f'{_PROC_DIR}/meminfo') if _HAS_PROCFS else None
+    if not data:
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        return (
+            _MemoryStats(memory.total, memory.used, memory.available, memory.percent),
+            _SwapStats(swap.total, swap.used, swap.percent)
+        )
+    
+    # Lines look like b'MemTotal:       16314276 kB'
+    fields = {}
+    for line in data.splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            fields[parts[0]] = int(parts[1]) * 1024
+    
+    total = fields.get(b'MemTotal:', 0)
+    free = fields.get(b'MemFree:', 0)
+    available = fields.get(b'MemAvailable:', 0)
+    if not available:
+        # Kernels before 3.14 (or the occasional 0 reading) - estimate like `free`
+        available = free + fields.get(b'Buffers:', 0) + fields.get(b'Cached:', 0)
+    if available > total:
+        available = free  # Container with host-level figures
+    
+    swap_total = fields.get(b'SwapTotal:', 0)
+    swap_used = swap_total - fields.get(b'SwapFree:', 0)
+    return (
+        _MemoryStats(total, total - available, available, _usage_percent(total - available, total)),
+        _SwapStats(swap_total, swap_used, _usage_percent(swap_used, swap_total))
+    )
+
+
+def _load_average() -> Optional[Tuple[float, float, float]]:
+    """1/5/15 minute load averages, read straight from /proc/loadavg on Linux."""
+    data = _read_proc_file(f'{_PROC_DIR}/loadavg') if _HAS_PROCFS else None
+    if data:
+        one, five, fifteen = data.split(None, 3)[:3]
+        return float(one), float(five), float(fifteen)
+    return psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
+
+
+# Previous (starttime, utime+stime ticks, sample time) per PID for cpu_percent
+# deltas, and resolved usernames per UID (pwd lookups parse /etc/passwd)
+_PREV_CPU_TICKS: Dict[int, Tuple[int, int, float]] = {}
+_USERNAMES: Dict[int, str] = {}
+# Owner per (pid, starttime): a process's real UID is fixed for its lifetime in
+# practice, and starttime changes when a PID is reused, so status is read once
+_PROC_OWNERS: Dict[Tuple[int, int], str] = {}
+# Serializes procfs sweeps: each one reads the previous baseline and swaps in its
+# own, so overlapping sweeps (overview executor vs /api/processes) must not interleave
+_PROCFS_SWEEP_LOCK = threading.Lock()
+
+
+def _username(uid: int) -> str:
+    """Username for a UID, cached; unknown UIDs are reported numerically like psutil does."""
+    name = _USERNAMES.get(uid)
+    if name is None:
+        try:
+            name = pwd.getpwuid(uid).pw_name
+        except KeyError:
+            name = str(uid)
+        _USERNAMES[uid] = name
+    return name
+
+
+def _parse_stat(data: bytes) -> Tuple[str, int, int, int]:
+    """(comm, starttime, utime + stime ticks, rss pages) from a /proc/<pid>/stat line."""
+    # comm is parenthesised and may itself contain spaces or parentheses
+    close = data.rindex(b')')
+    comm = data[data.index(b'(') + 1:close].decode(errors='replace')
+    # fields[0] is field 3 (state) in proc(5) numbering
+    fields = data[close + 2:].split()
+    return comm, int(fields[19]), int(fields[11]) + int(fields[12]), int(fields[21])
+
+
+def _parse_real_uid(status: bytes) -> int:
+    """Real UID from the `Uid:` line of /proc/<pid>/status."""
+    start = status.index(b'\nUid:') + 5
+    return int(status[start:].split(None, 1)[0])
+
+
+def _procfs_processes(pids: List[int], total_memory: int) -> List[Dict[str, Any]]:
+    """
+    Build process rows straight from procfs: one stat read per PID per sweep,
+    plus a status read the first time each process is seen.
+    
+    cpu_percent matches psutil's interval=None semantics - the share of one CPU
+    used since the previous sweep, 0.0 the first time a process is seen.
+    """
+    global _PREV_CPU_TICKS, _PROC_OWNERS
+    with _PROCFS_SWEEP_LOCK:
+        stats = _read_proc_batch([f'{_PROC_DIR}/{pid}/stat' for pid in pids])
+        now = time.monotonic()
+        previous = _PREV_CPU_TICKS
+        owners = _PROC_OWNERS
+        current: Dict[int, Tuple[int, int, float]] = {}
+        seen_owners: Dict[Tuple[int, int], str] = {}
+        processes = []
+        
+        for pid in pids:
+            stat = stats[f'{_PROC_DIR}/{pid}/stat']
+            if not stat:
+                continue  # Process exited during the sweep
+            try:
+                name, starttime, ticks, rss_pages = _parse_stat(stat)
+            except (ValueError, IndexError):
+                continue
+            
+            username = owners.get((pid, starttime))
+            if username is None:
+                status = _read_proc_file(f'{_PROC_DIR}/{pid}/status')
+                if not status:
+                    continue  # Exited between the stat and status reads
+                try:
+                    username = _username(_parse_real_uid(status))
+                except (TypeError, ValueError, IndexError):
+                    continue  # Exited before its status could be read
+            seen_owners[(pid, starttime)] = username
+            
+            current[pid] = (starttime, ticks, now)
+            before = previous.get(pid)
+            # A different starttime means the PID was reused by a new process
+            if before is not None and before[0] == starttime and now > before[2]:
+                cpu_percent = round((ticks - before[1]) / _CLK_TCK / (now - before[2]) * 100, 1)
+            else:
+                cpu_percent = 0.0
+            
+            rss = rss_pages * _PAGE_SIZE
+            processes.append({
+                'pid': pid,
+                'name': name,
+                'username': username,
+                'cpu_percent': cpu_percent,
+                'memory_percent': rss / total_memory * 100,
+                'memory_mb': round(rss / (1024*1024), 1)
+            })
+        
+        # Replacing both maps wholesale also prunes processes that have exited
+        _PREV_CPU_TICKS = current
+        _PROC_OWNERS = seen_owners
+        return processes
+
+
+# Long-lived Process objects, reused across requests so psutil keeps its
+# per-process state (e.g. the previous CPU times behind cpu_percent)
+_PROC_CACHE: Dict[int, psutil.Process] = {}
+_PROC_CACHE_LOCK = threading.Lock()
+
+
+def _cached_processes(pids: List[int]) -> List[psutil.Process]:
+    """Return Process objects for `pids`, evicting exited PIDs and creating new ones lazily."""
+    live = set(pids)
+    processes = []
+    with _PROC_CACHE_LOCK:
+        for pid in [pid for pid in _PROC_CACHE if pid not in live]:
+            del _PROC_CACHE[pid]
+        
+        for pid in pids:
+            proc = _PROC_CACHE.get(pid)
+            # is_running() compares create times, so a reused PID gets a fresh object
+            if proc is None or not proc.is_running():
+                try:
+                    proc = psutil.Process(pid)
+                except psutil.NoSuchProcess:
+                    _PROC_CACHE.pop(pid, None)
+                    continue
+                _PROC_CACHE[pid] = proc
+            processes.append(proc)
+    return processes
+
+
+# System-wide CPU usage sampled by a background thread, so requests read the
+# latest (total, per_cpu) values instead of sleeping through a measurement window.
+# With no consumers the sampling interval backs off from 1s towards 15s.
+_CPU_SAMPLE_INTERVAL = 1.0
+_CPU_SAMPLE_MAX_INTERVAL = 15.0
+_CPU_IDLE_STEP = 5.0  # Seconds without a consumer per 1.5x backoff step
+_CPU_SAMPLE: Tuple[float, List[float]] = (0.0, [])
+_CPU_SAMPLE_READY = threading.Event()
+_CPU_SAMPLER_LOCK = threading.Lock()
+_CPU_SAMPLER_PID: Optional[int] = None
+_CPU_SAMPLER_WAKE = threading.Event()
+_CPU_SAMPLER_DELAY = _CPU_SAMPLE_INTERVAL
+_CPU_LAST_CONSUMER = time.monotonic()
+
+
+def _cpu_sampler_delay(idle: float) -> float:
+    """Sampling interval after `idle` seconds without a consumer (1s, then 1.5x per step, capped)."""
+    steps = int(idle / _CPU_IDLE_STEP)
+    if steps <= 0:
+        return _CPU_SAMPLE_INTERVAL
+    return min(_CPU_SAMPLE_MAX_INTERVAL, _CPU_SAMPLE_INTERVAL * 1.5 ** min(steps, 16))
+
+
+def _cpu_sampler_loop(wake: threading.Event) -> None:
+    """Refresh _CPU_SAMPLE until `wake` is retired; non-blocking calls measure since the previous one."""
+    global _CPU_SAMPLE, _CPU_SAMPLER_DELAY
+    psutil.cpu_percent(interval=None)
+    psutil.cpu_percent(interval=None, percpu=True)
+    while wake is _CPU_SAMPLER_WAKE:
+        _CPU_SAMPLER_DELAY = _cpu_sampler_delay(time.monotonic() - _CPU_LAST_CONSUMER)
+        # A consumer arriving during a long backoff sets `wake`; the sample then
+        # covers the whole idle window and the next interval is back to 1s
+        if wake.wait(timeout=_CPU_SAMPLER_DELAY):
+            wake.clear()
+        if wake is not _CPU_SAMPLER_WAKE:
+            return
+        _CPU_SAMPLE = (
+            psutil.cpu_percent(interval=None),
+            psutil.cpu_percent(interval=None, percpu=True)
+        )
+        _CPU_SAMPLE_READY.set()
+
+
+def _latest_cpu_sample() -> Tuple[float, List[float]]:
+    """
+    Latest (total, per_cpu) usage, starting the sampler thread on first use.
+    
+    The thread is started lazily and per process, so forked workers (gunicorn
+    --preload) each get their own sampler; only the very first call waits for
+    an initial measurement.
+    """
+    global _CPU_SAMPLER_PID, _CPU_LAST_CONSUMER
+    _CPU_LAST_CONSUMER = time.monotonic()
+    pid = os.getpid()
+    if _CPU_SAMPLER_PID != pid:
+        with _CPU_SAMPLER_LOCK:
+            if _CPU_SAMPLER_PID != pid:
+                _CPU_SAMPLE_READY.clear()
+                threading.Thread(
+                    target=_cpu_sampler_loop, args=(_CPU_SAMPLER_WAKE,),
+                    name='cpu-sampler', daemon=True
+                ).start()
+                _CPU_SAMPLER_PID = pid
+    elif _CPU_SAMPLER_DELAY > _CPU_SAMPLE_INTERVAL:
+        _CPU_SAMPLER_WAKE.set()
+    _CPU_SAMPLE_READY.wait(timeout=_CPU_SAMPLE_INTERVAL * 2)
+    return _CPU_SAMPLE
+
+
+def _reset_cpu_sampler() -> None:
+    """Stop the sampler thread and drop its state; the next consumer starts a fresh one (for tests)."""
+    global _CPU_SAMPLER_PID, _CPU_SAMPLER_WAKE, _CPU_SAMPLER_DELAY, _CPU_SAMPLE
+    with _CPU_SAMPLER_LOCK:
+        retired = _CPU_SAMPLER_WAKE
+        _CPU_SAMPLER_WAKE = threading.Event()
+        retired.set()
+        _CPU_SAMPLER_PID = None
+        _CPU_SAMPLER_DELAY = _CPU_SAMPLE_INTERVAL
+        _CPU_SAMPLE = (0.0, [])
+        _CPU_SAMPLE_READY.clear()
+    get_cpu_info.cache_clear()
+
+
+@_stamped
+@_ttl_cache(_METRICS_TTL)
 def get_cpu_info() -> Dict[str, Any]:
     """
     Get comprehensive CPU information and usage.
@@ -21,38 +455,36 @@ def get_cpu_info() -> Dict[str, Any]:
     - High CPU usage might indicate heavy processes or system stress
     - Multiple cores allow parallel processing (important for homelab services)
     
+    Args:
+        _now: ISO timestamp shared by get_system_overview (default: current time)
+        
     Returns:
         Dict containing CPU metrics and explanations
     """
-    cpu_percent = psutil.cpu_percent(interval=1)
-    cpu_count_logical = psutil.cpu_count(logical=True)
-    cpu_count_physical = psutil.cpu_count(logical=False)
+    cpu_percent, per_core_usage = _latest_cpu_sample()
     cpu_freq = psutil.cpu_freq()
     
-    # Get per-core usage for detailed analysis
-    per_core_usage = psutil.cpu_percent(interval=0.1, percpu=True)
-    
     return {
         'usage_percent': cpu_percent,
-        'usage_explanation': f"CPU is {cpu_percent}% busy. " + 
-                           ("High usage (>80%) may slow down other processes." if cpu_percent > 80 
-                            else "Normal usage level." if cpu_percent < 50 
-                            else "Moderate usage - monitor if sustained."),
+        'usage_explanation': _CPU_USAGE_TEMPLATE.format(
+            usage=cpu_percent, note=_status_text(cpu_percent, _CPU_USAGE_NOTES)
+        ),
         'cores': {
-            'logical': cpu_count_logical,
-            'physical': cpu_count_physical,
-            'explanation': f"Your system has {cpu_count_physical} physical cores with {cpu_count_logical} threads (hyperthreading: {'enabled' if cpu_count_logical > cpu_count_physical else 'disabled'})"
+            'logical': _CPU_LOGICAL,
+            'physical': _CPU_PHYSICAL,
+            'explanation': _CORES_EXPLANATION
         },
         'frequency': {
             'current': round(cpu_freq.current, 2) if cpu_freq else None,
             'max': round(cpu_freq.max, 2) if cpu_freq else None,
             'explanation': f"Running at {cpu_freq.current:.1f}MHz (max: {cpu_freq.max:.1f}MHz)" if cpu_freq else "Frequency data not available"
         },
-        'per_core_usage': per_core_usage,
-        'timestamp': datetime.now().isoformat()
+        'per_core_usage': per_core_usage
     }
 
 
+@_stamped
+@_ttl_cache(_METRICS_TTL)
 def get_memory_info() -> Dict[str, Any]:
     """
     Get memory usage information with educational context.
@@ -62,23 +494,20 @@ def get_memory_info() -> Dict[str, Any]:
     - High memory usage forces system to use slower disk swap
     - Understanding memory usage helps optimize homelab services
     
+    Args:
+        _now: ISO timestamp shared by get_system_overview (default: current time)
+        
     Returns:
         Dict containing memory metrics and explanations
     """
-    memory = psutil.virtual_memory()
-    swap = psutil.swap_memory()
-    
-    # Convert bytes to GB for readability
-    total_gb = round(memory.total / (1024**3), 2)
-    used_gb = round(memory.used / (1024**3), 2)
-    available_gb = round(memory.available / (1024**3), 2)
-    
-    memory_status = (
-        "Critical - consider closing applications or adding RAM" if memory.percent > 90
-        else "High - monitor closely" if memory.percent > 80
-        else "Moderate - normal for active homelab" if memory.percent > 60
-        else "Good - plenty of available memory"
-    )
+    memory, swap = _memory_stats()
+    
+    # Convert bytes to GB; rounding happens only in the explanation text
+    total_gb = memory.total / _GIB
+    used_gb = memory.used / _GIB
+    available_gb = memory.available / _GIB
+    
+    memory_status = _status_text(memory.percent, _MEMORY_STATUSES)
     
     return {
         'total_gb': total_gb,
@@ -86,17 +515,34 @@ def get_memory_info() -> Dict[str, Any]:
         'available_gb': available_gb,
         'usage_percent': memory.percent,
         'status': memory_status,
-        'explanation': f"Using {used_gb}GB of {total_gb}GB RAM ({memory.percent:.1f}%). {memory_status}.",
+        'explanation': f"Using {_fmt_gb(memory.used)}GB of {_fmt_gb(memory.total)}GB RAM ({memory.percent:.1f}%). {memory_status}.",
         'swap': {
-            'total_gb': round(swap.total / (1024**3), 2) if swap.total > 0 else 0,
-            'used_gb': round(swap.used / (1024**3), 2) if swap.used > 0 else 0,
+            'total_gb': swap.total / _GIB,
+            'used_gb': swap.used / _GIB,
             'percent': swap.percent,
             'explanation': f"Swap usage: {swap.percent:.1f}% ({'actively swapping - may impact performance' if swap.percent > 10 else 'minimal swap usage - good'})"
-        },
-        'timestamp': datetime.now().isoformat()
+        }
     }
 
 
+# What common mount points are for
+_MOUNT_EXPLANATIONS = {
+    '/': 'Root filesystem - contains system files and programs',
+    '/home': 'User data and personal files',
+    '/var': 'Variable data - logs, databases, cache',
+    '/tmp': 'Temporary files - cleaned on reboot',
+    '/boot': 'Boot files - kernel and bootloader'
+}
+
+
+@_ttl_cache(30)
+def _list_partitions() -> List[Any]:
+    """Mounted partitions; topology rarely changes, so the mount table is re-read every 30s."""
+    return psutil.disk_partitions()
+
+
+@_stamped
+@_ttl_cache(_METRICS_TTL)
 def get_disk_info() -> Dict[str, Any]:
     """
     Get disk usage information for all mounted filesystems.
@@ -106,35 +552,29 @@ def get_disk_info() -> Dict[str, Any]:
     - Different mount points serve different purposes (/home, /var, etc.)
     - Understanding disk usage helps manage homelab storage
     
+    Args:
+        _now: ISO timestamp shared by get_system_overview (default: current time)
+        
     Returns:
         Dict containing disk usage metrics and explanations
     """
     disk_info = {}
-    partitions = psutil.disk_partitions()
+    partitions = _list_partitions()
     
     for partition in partitions:
         try:
             usage = psutil.disk_usage(partition.mountpoint)
             
-            total_gb = round(usage.total / (1024**3), 2)
-            used_gb = round(usage.used / (1024**3), 2)
-            free_gb = round(usage.free / (1024**3), 2)
+            total_gb = usage.total / _GIB
+            used_gb = usage.used / _GIB
+            free_gb = usage.free / _GIB
             
-            disk_status = (
-                "Critical - cleanup needed immediately" if usage.percent > 95
-                else "High - cleanup recommended" if usage.percent > 85
-                else "Moderate - monitor growth" if usage.percent > 70
-                else "Good - sufficient space"
-            )
+            disk_status = _status_text(usage.percent, _DISK_STATUSES)
             
             # Explain what common mount points are for
-            mount_explanation = {
-                '/': 'Root filesystem - contains system files and programs',
-                '/home': 'User data and personal files',
-                '/var': 'Variable data - logs, databases, cache',
-                '/tmp': 'Temporary files - cleaned on reboot',
-                '/boot': 'Boot files - kernel and bootloader'
-            }.get(partition.mountpoint, f'Mounted storage at {partition.mountpoint}')
+            mount_explanation = _MOUNT_EXPLANATIONS.get(
+                partition.mountpoint, f'Mounted storage at {partition.mountpoint}'
+            )
             
             disk_info[partition.mountpoint] = {
                 'device': partition.device,
@@ -144,7 +584,7 @@ def get_disk_info() -> Dict[str, Any]:
                 'free_gb': free_gb,
                 'usage_percent': usage.percent,
                 'status': disk_status,
-                'explanation': f"{mount_explanation}. Using {used_gb}GB of {total_gb}GB ({usage.percent:.1f}%). {disk_status}."
+                'explanation': f"{mount_explanation}. Using {_fmt_gb(usage.used)}GB of {_fmt_gb(usage.total)}GB ({usage.percent:.1f}%). {disk_status}."
             }
             
         except PermissionError:
@@ -157,11 +597,12 @@ def get_disk_info() -> Dict[str, Any]:
             }
     
     return {
-        'partitions': disk_info,
-        'timestamp': datetime.now().isoformat()
+        'partitions': disk_info
     }
 
 
+@_stamped
+@_ttl_cache(_METRICS_TTL)
 def get_top_processes(limit: int = 10) -> Dict[str, Any]:
     """
     Get information about the most resource-intensive processes.
@@ -173,39 +614,76 @@ def get_top_processes(limit: int = 10) -> Dict[str, Any]:
     
     Args:
         limit: Number of top processes to return
+        _now: ISO timestamp shared by get_system_overview (default: current time)
         
     Returns:
         Dict containing top processes by CPU and memory usage
     """
-    processes = []
-    
-    for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'memory_info']):
-        try:
-            # Get process info
-            process_info = proc.info
-            process_info['memory_mb'] = round(process_info['memory_info'].rss / (1024*1024), 1)
-            del process_info['memory_info']  # Remove the raw memory_info object
-            processes.append(process_info)
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            # Process might have ended or we don't have permission
-            pass
+    pids = _list_pids()
+    total_memory = _memory_stats()[0].total
     
-    # Sort by CPU usage
-    cpu_top = sorted(processes, key=lambda x: x['cpu_percent'] or 0, reverse=True)[:limit]
+    if _HAS_PROCFS:
+        # Linux: parse /proc directly instead of a psutil call chain per process
+        processes = _procfs_processes(pids, total_memory)
+    else:
+        processes = []
+        for proc in _cached_processes(pids):
+            try:
+                # oneshot() batches the underlying per-process syscalls for
+                # the reads below - only what the dashboard shows
+                with proc.oneshot():
+                    try:
+                        username = proc.username()
+                    except psutil.AccessDenied:
+                        username = None
+                    rss = proc.memory_info().rss
+                    processes.append({
+                        'pid': proc.pid,
+                        'name': proc.name(),
+                        'username': username,
+                        'cpu_percent': proc.cpu_percent(interval=None),
+                        'memory_percent': rss / total_memory * 100,
+                        'memory_mb': round(rss / (1024*1024), 1)
+                    })
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                # Process might have ended or we don't have permission
+                pass
     
-    # Sort by memory usage
-    memory_top = sorted(processes, key=lambda x: x['memory_percent'] or 0, reverse=True)[:limit]
+    # Top-k selection is O(n log k) and never materializes a fully sorted copy
+    cpu_top = heapq.nlargest(limit, processes, key=lambda x: x['cpu_percent'] or 0)
+    memory_top = heapq.nlargest(limit, processes, key=lambda x: x['memory_percent'] or 0)
     
     return {
         'top_cpu': cpu_top,
         'top_memory': memory_top,
         'total_processes': len(processes),
         'explanation': f"Monitoring {len(processes)} active processes. Top processes show what's currently using your system resources.",
-        'educational_note': "High CPU processes might be doing intensive work. High memory processes are keeping lots of data in RAM. Both are normal for active homelab services.",
-        'timestamp': datetime.now().isoformat()
+        'educational_note': "High CPU processes might be doing intensive work. High memory processes are keeping lots of data in RAM. Both are normal for active homelab services."
     }
 
 
+# Overview skeleton in response key order; static leaves are filled once here
+# and per-request values are assigned into a shallow copy
+_LOAD_AVERAGE_EXPLANATION = f"Load average shows system demand over time. Values above {_CPU_LOGICAL} indicate high demand."
+_OVERVIEW_TEMPLATE: Dict[str, Any] = {
+    'hostname': None,
+    'boot_time': datetime.fromtimestamp(_BOOT_TIME).isoformat(),
+    'uptime': None,
+    'load_average': None,
+    'cpu': None,
+    'memory': None,
+    'disk': None,
+    'processes': None,
+    'timestamp': None,
+    'health_summary': "System monitoring active - use individual metrics for detailed analysis"
+}
+
+# Shared worker pool for the overview fan-out, created once instead of spinning
+# up and joining four threads on every request
+_OVERVIEW_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='overview')
+
+
+@_ttl_cache(_METRICS_TTL)
 def get_system_overview() -> Dict[str, Any]:
     """
     Get a comprehensive system overview combining all monitoring data.
@@ -218,40 +696,66 @@ def get_system_overview() -> Dict[str, Any]:
     Returns:
         Dict containing complete system status with educational context
     """
-    boot_time = datetime.fromtimestamp(psutil.boot_time())
-    uptime_seconds = time.time() - psutil.boot_time()
+    # One clock read shared by every child collector's timestamp
+    now = datetime.now()
+    timestamp = now.isoformat()
+    uptime_seconds = now.timestamp() - _BOOT_TIME
     uptime_days = int(uptime_seconds // 86400)
     uptime_hours = int((uptime_seconds % 86400) // 3600)
     uptime_minutes = int((uptime_seconds % 3600) // 60)
     
-    load_avg = psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
+    load_avg = _load_average()
     
-    overview = {
-        'hostname': psutil.Process().environ().get('HOSTNAME', 'unknown'),
-        'boot_time': boot_time.isoformat(),
-        'uptime': {
-            'days': uptime_days,
-            'hours': uptime_hours,
-            'minutes': uptime_minutes,
-            'explanation': f"System has been running for {uptime_days} days, {uptime_hours} hours, {uptime_minutes} minutes since last reboot"
-        },
-        'load_average': {
-            '1min': round(load_avg[0], 2) if load_avg else None,
-            '5min': round(load_avg[1], 2) if load_avg else None,
-            '15min': round(load_avg[2], 2) if load_avg else None,
-            'explanation': f"Load average shows system demand over time. Values above {psutil.cpu_count()} indicate high demand." if load_avg else "Load average not available on this system"
-        } if load_avg else None,
-        'cpu': get_cpu_info(),
-        'memory': get_memory_info(),
-        'disk': get_disk_info(),
-        'processes': get_top_processes(5),  # Just top 5 for overview
-        'timestamp': datetime.now().isoformat(),
-        'health_summary': "System monitoring active - use individual metrics for detailed analysis"
+    # The collectors are independent and spend their time in psutil syscalls
+    # (which release the GIL), so run them concurrently: wall-clock becomes the
+    # slowest collector rather than the sum of all four
+    cpu_future = _OVERVIEW_EXECUTOR.submit(get_cpu_info, _now=timestamp)
+    memory_future = _OVERVIEW_EXECUTOR.submit(get_memory_info, _now=timestamp)
+    disk_future = _OVERVIEW_EXECUTOR.submit(get_disk_info, _now=timestamp)
+    processes_future = _OVERVIEW_EXECUTOR.submit(get_top_processes, 5, _now=timestamp)  # Just top 5 for overview
+    
+    cpu = cpu_future.result()
+    memory = memory_future.result()
+    disk = disk_future.result()
+    processes = processes_future.result()
+    
+    # Copy the pre-keyed skeleton (static leaves already filled) and set the rest
+    overview = _OVERVIEW_TEMPLATE.copy()
+    overview['hostname'] = socket.gethostname()
+    overview['uptime'] = {
+        'days': uptime_days,
+        'hours': uptime_hours,
+        'minutes': uptime_minutes,
+        'explanation': f"System has been running for {uptime_days} days, {uptime_hours} hours, {uptime_minutes} minutes since last reboot"
     }
+    if load_avg:
+        overview['load_average'] = {
+            '1min': round(load_avg[0], 2),
+            '5min': round(load_avg[1], 2),
+            '15min': round(load_avg[2], 2),
+            'explanation': _LOAD_AVERAGE_EXPLANATION
+        }
+    overview['cpu'] = cpu
+    overview['memory'] = memory
+    overview['disk'] = disk
+    overview['processes'] = processes
+    overview['timestamp'] = timestamp
     
     return overview
 
 
+# Static monitoring explanations, built once and returned by reference
+_EDUCATIONAL_CONTEXT = {
+    'cpu_usage': "CPU usage shows how busy your processor is. High usage (>80%) for extended periods may indicate the need for optimization or hardware upgrades.",
+    'memory_usage': "Memory (RAM) usage shows how much working space your programs are using. When memory is full, the system uses slower disk swap.",
+    'disk_usage': "Disk usage shows storage consumption. Full disks can cause system failures, so monitoring and cleanup are essential.",
+    'processes': "Processes are running programs. Monitoring top processes helps identify what's using your system resources.",
+    'load_average': "Load average shows system demand over 1, 5, and 15 minutes. Values above your CPU core count indicate high demand.",
+    'uptime': "Uptime shows how long the system has been running since last reboot. Long uptimes indicate system stability.",
+    'monitoring_importance': "Regular monitoring helps predict issues, optimize performance, and maintain homelab reliability."
+}
+
+
 def get_educational_context() -> Dict[str, str]:
     """
     Provide educational explanations for system monitoring concepts.
@@ -259,12 +763,4 @@ def get_educational_context() -> Dict[str, str]:
     Returns:
         Dict containing explanations of key monitoring concepts
     """
-    return {
-        'cpu_usage': "CPU usage shows how busy your processor is. High usage (>80%) for extended periods may indicate the need for optimization or hardware upgrades.",
-        'memory_usage': "Memory (RAM) usage shows how much working space your programs are using. When memory is full, the system uses slower disk swap.",
-        'disk_usage': "Disk usage shows storage consumption. Full disks can cause system failures, so monitoring and cleanup are essential.",
-        'processes': "Processes are running programs. Monitoring top processes helps identify what's using your system resources.",
-        'load_average': "Load average shows system demand over 1, 5, and 15 minutes. Values above your CPU core count indicate high demand.",
-        'uptime': "Uptime shows how long the system has been running since last reboot. Long uptimes indicate system stability.",
-        'monitoring_importance': "Regular monitoring helps predict issues, optimize performance, and maintain homelab reliability."
-    }
+    return _EDUCATIONAL_CONTEXT
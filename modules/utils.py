@@ -7,8 +7,14 @@ This module contains utility functions for homelab.
 
 import json
 import os
+import threading
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Callable, Optional
+
+# Calls currently running under single_flight, keyed by caller-chosen name
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
 
 def get_timestamp() -> str:
     """
@@ -93,3 +99,38 @@ def sanitize_filename(filename: str) -> str:
     # Remove or replace unsafe characters
     sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
     return sanitized.strip()
+
+def single_flight(key: str, fn: Callable[[], Any]) -> Any:
+    """
+    Run fn once for all concurrent callers sharing the same key
+    
+    The first caller executes fn in its own thread; callers arriving while it
+    is running wait for and receive the same result (or exception).
+    
+    Args:
+        key: Name identifying equivalent calls
+        fn: Zero-argument callable to execute
+        
+    Returns:
+        Any: The value returned by fn
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[key] = Future()
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        result = fn()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
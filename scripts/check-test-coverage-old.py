@@ -36,96 +36,78 @@ EXCLUDE_PATTERNS = [
     'get_status'      # Utility: returns static status information
 ]
 
-# Template escaping patterns to prevent regex parsing failures
-TEMPLATE_ESCAPE_PATTERNS = [
-    (r'\{\{[^}]*\}\}', '{{ VAR }}'),           # Jinja2 variables
-    (r'\{%[^%]*%\}', '{% TAG %}'),             # Jinja2 tags
-    (r'render_template_string\([^)]*\)', '""'), # Template strings
-    (r'"""[^"]*\{\{[^}]*\}\}[^"]*"""', '""'),  # Multiline strings with templates
-]
+# Whole function names hit the frozenset directly; everything else is one scan
+# of a precompiled alternation (still substring semantics, as before)
+_EXCLUDE_NAMES = frozenset(EXCLUDE_PATTERNS)
+_EXCLUDE_RE = re.compile('|'.join(map(re.escape, EXCLUDE_PATTERNS)))
 
 # --- Helper functions ---
-def sanitize_for_parsing(content):
-    """Remove template syntax that interferes with regex parsing"""
-    for pattern, replacement in TEMPLATE_ESCAPE_PATTERNS:
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-    return content
+def parse_source(path):
+    """Read a Python file once and parse it; source needs no sanitizing to be valid Python"""
+    with open(path, 'r') as f:
+        return ast.parse(f.read(), filename=path)
 
 def should_exclude_function(func_name):
     """Exclude utility functions and private functions that don't need comprehensive testing"""
-    # Exclude private functions (starting with underscore)
-    if func_name.startswith('_'):
-        return True
-    # Exclude utility functions matching patterns
-    return any(pattern in func_name for pattern in EXCLUDE_PATTERNS)
+    # Exclude private functions (starting with underscore) and utility functions matching patterns
+    return (
+        func_name.startswith('_')
+        or func_name in _EXCLUDE_NAMES
+        or _EXCLUDE_RE.search(func_name) is not None
+    )
 
-def get_functions_from_module(module_path):
-    with open(module_path, 'r') as f:
-        content = f.read()
-    # Sanitize content to handle template strings before AST parsing
-    sanitized_content = sanitize_for_parsing(content)
+def _classify_functions(module_path):
+    """Parse and walk a module once, returning (kept, excluded) function names"""
     try:
-        tree = ast.parse(sanitized_content, filename=module_path)
-        all_functions = [n.name for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
-        # Filter out utility functions that don't need comprehensive testing
-        return [f for f in all_functions if not should_exclude_function(f)]
+        tree = parse_source(module_path)
     except SyntaxError as e:
         print(f"⚠️  Warning: Could not parse {module_path}: {e}")
-        return []
+        return set(), set()
+    kept, excluded = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            # Utility functions don't need comprehensive testing
+            (excluded if should_exclude_function(node.name) else kept).add(node.name)
+    return kept, excluded
+
+def _route_path(decorator):
+    """Return the path literal of an `@app.route("...")` decorator, else None"""
+    if not (isinstance(decorator, ast.Call) and decorator.args):
+        return None
+    func = decorator.func
+    if not (isinstance(func, ast.Attribute) and func.attr == 'route'
+            and isinstance(func.value, ast.Name) and func.value.id == 'app'):
+        return None
+    path = decorator.args[0]
+    if isinstance(path, ast.Constant) and isinstance(path.value, str):
+        return path.value
+    return None
 
 def get_api_endpoints(api_path):
     endpoints = set()
     if not os.path.exists(api_path):
         return endpoints
     
-    with open(api_path, 'r') as f:
-        content = f.read()
-    
-    # Sanitize content before regex parsing
-    sanitized_content = sanitize_for_parsing(content)
-    
-    for line in sanitized_content.split('\n'):
-        m = re.search(r'@app\.route\(["\'](/api/[^"\']*)', line)
-        if m:
-            endpoints.add(m.group(1))
+    for node in ast.walk(parse_source(api_path)):
+        if isinstance(node, ast.FunctionDef):
+            for decorator in node.decorator_list:
+                path = _route_path(decorator)
+                if path and path.startswith('/api/'):
+                    endpoints.add(path)
     return endpoints
 
 def get_test_dict_keys(test_path, dict_name):
-    """Extract test dictionary keys from both global scope and method scope"""
-    with open(test_path, 'r') as f:
-        content = f.read()
-    
-    # Try global scope first (legacy format)
-    global_match = re.search(rf'{dict_name}\s*=\s*{{(.*?)}}', content, re.DOTALL)
-    if global_match:
-        dict_body = global_match.group(1)
-        keys = re.findall(r'"([^"]+)":', dict_body)
-        return set(keys)
-    
-    # Method scope approach: parse line by line to handle nested dictionaries
-    lines = content.split('\n')
-    in_target_dict = False
-    keys = []
-    brace_count = 0
-    
-    for line in lines:
-        if f'{dict_name} = {{' in line:
-            in_target_dict = True
-            brace_count = line.count('{') - line.count('}')
+    """Extract top-level keys of a `dict_name = {...}` assignment at global or method scope"""
+    keys = set()
+    for node in ast.walk(parse_source(test_path)):
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)):
             continue
-        
-        if in_target_dict:
-            brace_count += line.count('{') - line.count('}')
-            
-            # Look for main keys (quoted strings at start of line with proper indentation)
-            match = re.match(r'\s+"([^"]+)":\s*{', line)
-            if match:
-                keys.append(match.group(1))
-            
-            if brace_count <= 0:
-                break
-    
-    return set(keys)
+        if any(isinstance(t, ast.Name) and t.id == dict_name for t in node.targets):
+            keys.update(
+                key.value for key in node.value.keys
+                if isinstance(key, ast.Constant) and isinstance(key.value, str)
+            )
+    return keys
 
 # --- Main check ---
 def main():
@@ -133,18 +115,14 @@ def main():
     all_backend_funcs = set()
     excluded_funcs = set()
     
-    for fname in os.listdir(MODULES_DIR):
-        if fname.endswith('.py'):
-            module_path = os.path.join(MODULES_DIR, fname)
-            with open(module_path, 'r') as f:
-                tree = ast.parse(f.read(), filename=module_path)
-            all_funcs = [n.name for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
-            
-            for func in all_funcs:
-                if should_exclude_function(func):
-                    excluded_funcs.add(func)
-                else:
-                    all_backend_funcs.add(func)
+    with os.scandir(MODULES_DIR) as entries:
+        for entry in entries:
+            # DirEntry carries the file type from readdir, so no extra stat per name
+            if not (entry.name.endswith('.py') and entry.is_file()):
+                continue
+            kept, excluded = _classify_functions(entry.path)
+            all_backend_funcs |= kept
+            excluded_funcs |= excluded
     
     # API endpoints
     api_endpoints = get_api_endpoints(API_FILE)
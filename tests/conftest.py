@@ -0,0 +1,41 @@
+"""
+Pytest hooks for the homelab test suite
+"""
+
+import threading
+
+import pytest
+
+# Fixtures that need the live homelab service
+_SERVICE_FIXTURES = frozenset({'live_server', 'require_service', 'api_responses', 'overview_response'})
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-service", action="store_true", default=False,
+        help="Skip tests that need the running homelab service without probing it"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """With --no-service, skip live-service tests before any fixture (or probe) runs"""
+    if not config.getoption("--no-service"):
+        return
+    skip = pytest.mark.skip(reason="Homelab service disabled with --no-service")
+    for item in items:
+        if not _SERVICE_FIXTURES.isdisjoint(getattr(item, 'fixturenames', ())):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def live_server():
+    """Serve the homelab app from a background thread for the whole run; yields its base URL"""
+    homelab = pytest.importorskip("homelab")
+    from werkzeug.serving import make_server
+    
+    server = make_server("127.0.0.1", 0, homelab.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.port}"
+    server.shutdown()
+    thread.join()
@@ -5,134 +5,396 @@ Simple, practical testing for a homelab monitoring system
 """
 
 import pytest
-import requests
-import importlib
+import subprocess
 import sys
 import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from typing import Dict, Any
+from urllib.parse import urlsplit
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from orjson import loads as _loads  # Optional: faster parsing of large API bodies
+except ImportError:
+    from json import loads as _loads
+
+try:
+    from modules import system_monitor, service_discovery
+    from modules.system_monitor import (
+        get_cpu_info, get_memory_info, get_disk_info, get_top_processes,
+        get_system_overview, get_educational_context,
+        _ttl_cache as ttl_cache, _parse_stat as parse_stat
+    )
+    from modules.service_discovery import (
+        get_systemd_services, get_service_categories, get_critical_services,
+        _categorize_service as categorize_service
+    )
+    from modules.core import get_status, process_data, validate_input
+    from modules.utils import get_timestamp, format_response, load_config, single_flight
+except ImportError as e:
+    pytest.skip(f"modules unavailable: {e}", allow_module_level=True)
 
 # Test configuration
-BASE_URL = "http://localhost:5000"
 TIMEOUT = 10
+PROBE_TIMEOUT = 0.2  # TCP connect probe; a closed port should not cost seconds
 
-class TestHelpers:
-    """Helper methods for homelab testing"""
+# Keys each payload must carry, checked with one set difference per test
+REQUIRED_OVERVIEW_KEYS = frozenset({'cpu', 'memory', 'disk', 'processes', 'uptime', 'timestamp', 'hostname'})
+REQUIRED_API_OVERVIEW_KEYS = frozenset({'cpu', 'memory', 'disk', 'processes'})
+EXPECTED_SERVICE_STATES = frozenset({'active', 'inactive', 'failed', 'masked'})
+EXPECTED_CATEGORIES = frozenset({'System Core', 'Network Services', 'Desktop Environment'})
+REQUIRED_MONITOR_KEYS: Dict[str, frozenset] = {
+    'cpu': frozenset({'usage_percent', 'cores', 'frequency'}),
+    'memory': frozenset({'total_gb', 'used_gb', 'usage_percent', 'status', 'swap', 'timestamp'}),
+    'disk': frozenset({'partitions', 'timestamp'}),
+    'processes': frozenset({'top_cpu', 'top_memory', 'total_processes', 'timestamp'}),
+    'overview': REQUIRED_OVERVIEW_KEYS,
+    'education': frozenset({'cpu_usage', 'memory_usage', 'disk_usage', 'processes', 'monitoring_importance'}),
+}
+REQUIRED_SERVICES_KEYS = frozenset({'services', 'summary', 'educational_context'})
+REQUIRED_CATEGORIES_KEYS = frozenset({'categories', 'category_descriptions'})
+REQUIRED_CRITICAL_KEYS = frozenset({'critical_services', 'educational_context'})
+REQUIRED_PROCESS_FIELDS = frozenset({'pid', 'name', 'username', 'cpu_percent', 'memory_percent'})
+
+# Fallback pool for helper calls made outside a test's `http` fixture
+_DEFAULT_POOL = None
+
+
+def _pool_manager():
+    """A urllib3 pool for the single test host (urllib3 is imported on first use)"""
+    urllib3 = pytest.importorskip("urllib3")
+    # One host; at most four concurrent requests (the dashboard consistency fan-out)
+    return urllib3.PoolManager(num_pools=1, maxsize=4, retries=False)
+
+
+def _default_pool():
+    """Create the fallback pool on first use"""
+    global _DEFAULT_POOL
+    if _DEFAULT_POOL is None:
+        _DEFAULT_POOL = _pool_manager()
+    return _DEFAULT_POOL
+
+
+@pytest.fixture(scope="session")
+def http():
+    """One pooled keep-alive client shared by every integration/system test"""
+    pool = _pool_manager()
+    yield pool
+    pool.clear()
+
+
+@pytest.fixture(scope="session")
+def service_running(http, live_server):
+    """Probe /health once per run; the service state does not change mid-suite"""
+    return TestHelpers.check_service_running(live_server, pool=http)
+
+
+@pytest.fixture
+def require_service(service_running):
+    """Skip tests that need the live homelab service when it is not up"""
+    if not service_running:
+        pytest.skip("Homelab service is not running")
+
+
+# Independent JSON endpoints read once per module, in parallel
+API_PATHS = ("/health", "/api/overview", "/api/services")
+
+
+@pytest.fixture(scope="module")
+def api_responses(http, live_server, service_running):
+    """(status, payload) per API_PATHS entry, fetched concurrently so the reads overlap"""
+    if not service_running:
+        pytest.skip("Homelab service is not running")
     
-    @staticmethod
-    def import_module_function(module_name: str, function_name: str):
-        """Safely import a function from a module"""
+    def fetch(path):
+        response = http.request("GET", f"{live_server}{path}", timeout=TIMEOUT)
+        return response.status, _loads(response.data)
+    
+    with ThreadPoolExecutor(max_workers=len(API_PATHS)) as executor:
+        return dict(zip(API_PATHS, executor.map(fetch, API_PATHS)))
+
+
+@pytest.fixture(scope="module")
+def overview_response(api_responses):
+    """One /api/overview read, as (status, payload), for tests that only check its shape"""
+    return api_responses["/api/overview"]
+
+
+# TTL-cached collectors, cleared around canned readings so no test sees another's data
+_CACHED_COLLECTORS = (get_cpu_info, get_memory_info, get_disk_info, get_top_processes, get_system_overview)
+
+
+def _patch_psutil(mp, system_monitor):
+    """Replace the sampled/slow psutil reads with fixed values (process list is just this test run)"""
+    logical = system_monitor._CPU_LOGICAL
+    mp.setattr(system_monitor, "_latest_cpu_sample", lambda: (12.3, [12.3] * logical))
+    mp.setattr(system_monitor.psutil, "cpu_freq", lambda: SimpleNamespace(current=2400.0, min=800.0, max=3600.0))
+    mp.setattr(system_monitor, "_list_partitions", lambda: [
+        SimpleNamespace(device='/dev/sda1', mountpoint='/', fstype='ext4', opts='rw')
+    ])
+    mp.setattr(system_monitor.psutil, "disk_usage", lambda path: SimpleNamespace(
+        total=100 << 30, used=40 << 30, free=60 << 30, percent=40.0
+    ))
+    mp.setattr(system_monitor, "_list_pids", lambda: [os.getpid()])
+
+
+@pytest.fixture(scope="session")
+def monitor_snapshot():
+    """Each collector called once per session against canned psutil readings (schema only)"""
+    with pytest.MonkeyPatch.context() as mp:
+        _patch_psutil(mp, system_monitor)
+        for collector in _CACHED_COLLECTORS:
+            collector.cache_clear()
         try:
-            module = importlib.import_module(module_name)
-            return getattr(module, function_name)
-        except (ImportError, AttributeError) as e:
-            pytest.skip(f"Module or function not available: {e}")
+            return {
+                'cpu': get_cpu_info(),
+                'memory': get_memory_info(),
+                'disk': get_disk_info(),
+                'processes': get_top_processes(),
+                'overview': get_system_overview(),
+                'education': get_educational_context(),
+            }
+        finally:
+            for collector in _CACHED_COLLECTORS:
+                collector.cache_clear()
 
+
+class TestHelpers:
+    """Helper methods for homelab testing"""
+    
     @staticmethod
-    def check_service_running(url: str = BASE_URL) -> bool:
-        """Check if the homelab service is running"""
+    def check_service_running(url: str, pool=None) -> bool:
+        """Check if the homelab service is running (TCP probe, then GET /health)"""
+        address = urlsplit(url)
+        with socket.socket() as sock:
+            sock.settimeout(PROBE_TIMEOUT)
+            if sock.connect_ex((address.hostname, address.port or 80)) != 0:
+                return False
+        
+        from urllib3.exceptions import HTTPError
+        pool = pool or _default_pool()
         try:
-            response = requests.get(f"{url}/health", timeout=5)
-            return response.status_code == 200
-        except requests.RequestException:
+            response = pool.request("GET", f"{url}/health", timeout=5)
+            return response.status == 200
+        except HTTPError:
             return False
 
 # Unit Tests - Core monitoring functions
 class TestSystemMonitoring:
-    """Test core system monitoring functionality"""
+    """
+    Test core system monitoring functionality
+    
+    Helpers that read several attributes of one psutil.Process should do it
+    inside `with proc.oneshot():`, as get_top_processes does, so each
+    /proc/<pid> file is parsed once rather than once per attribute.
+    """
     
     @pytest.mark.unit
-    def test_cpu_info(self):
-        """Test CPU information retrieval"""
-        get_cpu_info = TestHelpers.import_module_function(
-            "modules.system_monitor", "get_cpu_info"
-        )
+    @pytest.mark.parametrize("section", REQUIRED_MONITOR_KEYS)
+    def test_monitor_shape(self, monitor_snapshot, section):
+        """Test each collector returns a dict carrying its essential keys"""
+        result = monitor_snapshot[section]
         
+        assert isinstance(result, dict)
+        missing = REQUIRED_MONITOR_KEYS[section] - result.keys()
+        assert not missing, f"Missing required keys: {sorted(missing)}"
+
+    @pytest.mark.unit
+    @pytest.mark.smoke
+    def test_cpu_info(self):
+        """Test real CPU usage is a valid percentage"""
         result = get_cpu_info()
         
-        # Essential checks for homelab monitoring
-        assert 'usage_percent' in result
-        assert 'cores' in result
-        assert 'frequency' in result
         assert isinstance(result['usage_percent'], (int, float))
         assert 0 <= result['usage_percent'] <= 100
 
     @pytest.mark.unit
-    def test_memory_info(self):
-        """Test memory information retrieval"""
-        get_memory_info = TestHelpers.import_module_function(
-            "modules.system_monitor", "get_memory_info"
-        )
-        
-        result = get_memory_info()
+    @pytest.mark.smoke
+    def test_overview_real_psutil(self):
+        """Test the overview against real psutil readings (the shape tests use canned ones)"""
+        for collector in _CACHED_COLLECTORS:
+            collector.cache_clear()
+        result = get_system_overview()
         
-        assert 'total_gb' in result
-        assert 'used_gb' in result
-        assert 'usage_percent' in result
-        assert 'status' in result
-        assert 'swap' in result
-        assert 'timestamp' in result
+        missing = REQUIRED_OVERVIEW_KEYS - result.keys()
+        assert not missing, f"Missing required keys: {sorted(missing)}"
+        assert '/' in result['disk']['partitions']
+        assert result['processes']['total_processes'] > 0
 
     @pytest.mark.unit
-    def test_disk_info(self):
-        """Test disk information retrieval"""
-        get_disk_info = TestHelpers.import_module_function(
-            "modules.system_monitor", "get_disk_info"
+    def test_cpu_info_does_not_block(self):
+        """Test CPU usage comes from the background sampler once it has warmed up"""
+        import time
+        get_cpu_info()  # First call may wait for the initial sample
+        start = time.monotonic()
+        result = get_cpu_info()
+
+        assert time.monotonic() - start < 0.5
+        assert len(result['per_core_usage']) == result['cores']['logical']
+
+    @pytest.mark.unit
+    def test_cpu_sampler_backoff(self):
+        """Test the sampler slows down without consumers and restarts cleanly"""
+        delays = [system_monitor._cpu_sampler_delay(idle) for idle in (0, 4, 5, 10, 3600)]
+        assert delays[:2] == [1.0, 1.0]
+        assert 1.0 < delays[2] < delays[3] < delays[4] == 15.0
+
+        system_monitor._reset_cpu_sampler()
+        result = system_monitor.get_cpu_info()
+        assert len(result['per_core_usage']) == result['cores']['logical']
+
+    @pytest.mark.unit
+    def test_metrics_ttl_cache(self):
+        """Test collector results are reused within the TTL and keyed by arguments"""
+        calls = []
+
+        @ttl_cache(60)
+        def collect(limit=10, _option=None):
+            calls.append(limit)
+            return {'limit': limit}
+
+        assert collect() is collect()
+        assert collect(limit=5) == {'limit': 5}
+        assert collect(limit=5, _option='ignored') == {'limit': 5}
+        assert calls == [10, 5]
+
+        collect.cache_clear()
+        collect()
+        assert calls == [10, 5, 10]
+
+    @pytest.mark.unit
+    def test_cached_collector_timestamp_per_call(self, monkeypatch):
+        """Test a TTL-cache hit still carries the caller's _now, not the first caller's"""
+        _patch_psutil(monkeypatch, system_monitor)
+        get_cpu_info.cache_clear()
+        try:
+            first = get_cpu_info()
+            shared = "2000-01-01T00:00:00"
+            second = get_cpu_info(_now=shared)
+            assert second['timestamp'] == shared
+            assert first['timestamp'] != shared
+            assert get_cpu_info()['timestamp'] != shared
+        finally:
+            get_cpu_info.cache_clear()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("table,value,prefix", [
+        ("_CPU_USAGE_NOTES", 49.9, "Normal"),
+        ("_CPU_USAGE_NOTES", 49.96, "Normal"),
+        ("_CPU_USAGE_NOTES", 50.0, "Moderate"),
+        ("_CPU_USAGE_NOTES", 80.0, "Moderate"),
+        ("_CPU_USAGE_NOTES", 80.1, "High"),
+        ("_MEMORY_STATUSES", 60.0, "Good"),
+        ("_MEMORY_STATUSES", 90.1, "Critical"),
+        ("_DISK_STATUSES", 85.5, "High"),
+    ])
+    def test_status_thresholds(self, table, value, prefix):
+        """Test threshold tables keep the original boundary semantics"""
+        text = system_monitor._status_text(value, getattr(system_monitor, table))
+        assert text.startswith(prefix)
+
+    @pytest.mark.unit
+    def test_memory_stats_from_meminfo(self, monkeypatch):
+        """Test /proc/meminfo parsing uses psutil's used/available formulas"""
+        meminfo = (
+            b"MemTotal:        1000 kB\nMemFree:          200 kB\n"
+            b"MemAvailable:     600 kB\nBuffers:           50 kB\n"
+            b"Cached:           100 kB\nSwapTotal:        400 kB\nSwapFree:         300 kB\n"
         )
+        monkeypatch.setattr(system_monitor, "_HAS_PROCFS", True)
+        monkeypatch.setattr(system_monitor, "_read_proc_file", lambda path: meminfo)
+
+        memory, swap = system_monitor._memory_stats()
+
+        assert memory.total == 1000 * 1024
+        assert memory.available == 600 * 1024
+        assert memory.used == 400 * 1024
+        assert memory.percent == 40.0
+        assert swap.used == 100 * 1024
+        assert swap.percent == 25.0
+
+    @pytest.mark.unit
+    def test_disk_info(self, monitor_snapshot):
+        """Test disk partitions are keyed by mountpoint"""
+        result = monitor_snapshot['disk']
         
-        result = get_disk_info()
-        
-        assert 'partitions' in result
-        assert 'timestamp' in result
         assert isinstance(result['partitions'], dict)
 
     @pytest.mark.unit
-    def test_top_processes(self):
-        """Test process monitoring"""
-        get_top_processes = TestHelpers.import_module_function(
-            "modules.system_monitor", "get_top_processes"
-        )
+    def test_top_processes(self, monitor_snapshot):
+        """Test process rankings are lists"""
+        result = monitor_snapshot['processes']
         
-        result = get_top_processes()
-        
-        assert 'top_cpu' in result
-        assert 'top_memory' in result
-        assert 'total_processes' in result
-        assert 'timestamp' in result
         assert isinstance(result['top_cpu'], list)
         assert isinstance(result['top_memory'], list)
 
     @pytest.mark.unit
-    def test_system_overview(self):
-        """Test comprehensive system overview"""
-        get_system_overview = TestHelpers.import_module_function(
-            "modules.system_monitor", "get_system_overview"
-        )
-        
-        result = get_system_overview()
-        
-        # Core homelab monitoring data
-        required_keys = ['cpu', 'memory', 'disk', 'processes', 'uptime', 'timestamp', 'hostname']
-        for key in required_keys:
-            assert key in result, f"Missing required key: {key}"
+    def test_top_processes_psutil_fallback(self, monkeypatch):
+        """Test the non-procfs path reads each process inside one oneshot() block"""
+        import psutil
+        oneshot = psutil.Process.oneshot
+        calls = []
+
+        def counting_oneshot(proc):
+            calls.append(proc.pid)
+            return oneshot(proc)
+
+        monkeypatch.setattr(system_monitor, "_HAS_PROCFS", False)
+        monkeypatch.setattr(psutil.Process, "oneshot", counting_oneshot)
+        get_top_processes.cache_clear()
+        try:
+            result = get_top_processes(limit=5)
+        finally:
+            get_top_processes.cache_clear()
+
+        assert calls and len(calls) == len(set(calls))
+        assert 0 < len(result['top_memory']) <= 5
+        assert REQUIRED_PROCESS_FIELDS <= result['top_memory'][0].keys()
 
     @pytest.mark.unit
-    def test_educational_context(self):
-        """Test educational context functionality - PREVIOUSLY MISSING"""
-        get_educational_context = TestHelpers.import_module_function(
-            "modules.system_monitor", "get_educational_context"
-        )
-        
-        result = get_educational_context()
-        
-        assert 'cpu_usage' in result
-        assert 'memory_usage' in result
-        assert 'disk_usage' in result
-        assert 'processes' in result
-        assert 'monitoring_importance' in result
-        assert isinstance(result, dict)
+    def test_parse_proc_stat(self):
+        """Test /proc/<pid>/stat parsing copes with spaces and parentheses in comm"""
+        fields = ['S'] + [str(n) for n in range(4, 53)]
+        line = ('1234 (tmux: (server) x) ' + ' '.join(fields)).encode()
+
+        # utime/stime are fields 14/15, starttime 22 and rss 24 in proc(5)
+        assert parse_stat(line) == ('tmux: (server) x', 22, 14 + 15, 24)
+
+    @pytest.mark.unit
+    def test_process_owner_cached_per_process(self, monkeypatch):
+        """Test /proc/<pid>/status is read once per process, not on every sweep"""
+        if not system_monitor._HAS_PROCFS:
+            pytest.skip("procfs not available")
+        real_read = system_monitor._read_proc_file
+        status_reads = []
+
+        def counting_read(path):
+            if path.endswith('/status'):
+                status_reads.append(path)
+            return real_read(path)
+
+        monkeypatch.setattr(system_monitor, "_read_proc_file", counting_read)
+        monkeypatch.setattr(system_monitor, "_PROC_OWNERS", {})
+        pids = [os.getpid()]
+
+        first = system_monitor._procfs_processes(pids, 1 << 30)
+        second = system_monitor._procfs_processes(pids, 1 << 30)
+
+        assert len(status_reads) == 1
+        assert first[0]['username'] == second[0]['username']
+
+    @pytest.mark.unit
+    def test_process_exit_before_status_read(self, monkeypatch):
+        """Test a PID whose status file vanished after its stat read is skipped"""
+        if not system_monitor._HAS_PROCFS:
+            pytest.skip("procfs not available")
+        real_read = system_monitor._read_proc_file
+        monkeypatch.setattr(system_monitor, "_read_proc_file",
+                            lambda path: None if path.endswith('/status') else real_read(path))
+        monkeypatch.setattr(system_monitor, "_PROC_OWNERS", {})
+
+        assert system_monitor._procfs_processes([os.getpid()], 1 << 30) == []
 
 class TestServiceDiscovery:
     """Test service discovery functionality"""
@@ -140,69 +402,178 @@ class TestServiceDiscovery:
     @pytest.mark.unit
     def test_systemd_services(self):
         """Test systemd service discovery"""
-        get_systemd_services = TestHelpers.import_module_function(
-            "modules.service_discovery", "get_systemd_services"
-        )
-        
         result = get_systemd_services()
         
-        assert 'services' in result
-        assert 'summary' in result
-        assert 'educational_context' in result
+        missing = REQUIRED_SERVICES_KEYS - result.keys()
+        assert not missing, f"Missing required keys: {sorted(missing)}"
         
         # Check service categories
         services = result['services']
-        expected_states = ['active', 'inactive', 'failed', 'masked']
-        for state in expected_states:
-            assert state in services
+        missing = EXPECTED_SERVICE_STATES - services.keys()
+        assert not missing, f"Missing service states: {sorted(missing)}"
 
     @pytest.mark.unit  
     def test_service_categories(self):
         """Test service categorization - PREVIOUSLY MISSING"""
-        get_service_categories = TestHelpers.import_module_function(
-            "modules.service_discovery", "get_service_categories"
-        )
-        
         result = get_service_categories()
         
-        assert 'categories' in result
-        assert 'category_descriptions' in result
+        missing = REQUIRED_CATEGORIES_KEYS - result.keys()
+        assert not missing, f"Missing required keys: {sorted(missing)}"
         assert isinstance(result['categories'], dict)
         assert isinstance(result['category_descriptions'], dict)
         
         # Check for expected categories
         categories = result['categories']
-        expected_categories = ['System Core', 'Network Services', 'Desktop Environment']
-        for category in expected_categories:
-            assert category in categories
+        missing = EXPECTED_CATEGORIES - categories.keys()
+        assert not missing, f"Missing categories: {sorted(missing)}"
 
     @pytest.mark.unit
     def test_critical_services(self):
         """Test critical services monitoring - PREVIOUSLY MISSING"""
-        get_critical_services = TestHelpers.import_module_function(
-            "modules.service_discovery", "get_critical_services"
-        )
-        
         result = get_critical_services()
         
-        assert 'critical_services' in result
-        assert 'educational_context' in result
+        missing = REQUIRED_CRITICAL_KEYS - result.keys()
+        assert not missing, f"Missing required keys: {sorted(missing)}"
         assert isinstance(result['critical_services'], dict)
         
         # Should have educational context
         edu_context = result['educational_context']
         assert 'what_are_critical_services' in edu_context
 
+    @pytest.mark.unit
+    def test_systemctl_cache_reuses_result(self, monkeypatch):
+        """Test repeated systemctl queries within the TTL share one subprocess"""
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            return subprocess.CompletedProcess(
+                args, 0, stdout='dbus.service loaded active running D-Bus System Message Bus\n'
+            )
+
+        monkeypatch.setattr(service_discovery, "SystemdManager", None)
+        monkeypatch.setattr(service_discovery.subprocess, "run", fake_run)
+        monkeypatch.setattr(service_discovery, "_SYSCTL_CACHE", {})
+
+        args = ('systemctl', 'list-units', '--type=service')
+        expected = [('dbus.service', 'loaded', 'active', 'running', 'D-Bus System Message Bus')]
+        assert service_discovery._cached_systemctl(args) == expected
+        assert service_discovery._cached_systemctl(args) == expected
+        assert len(calls) == 1
+
+        # An expired entry triggers a fresh query
+        service_discovery._cached_systemctl(args, ttl=0)
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_concurrent_cache_misses_share_one_systemctl(self, monkeypatch):
+        """Test simultaneous cache misses collapse onto a single subprocess"""
+        import threading
+        import time
+        calls = []
+
+        def slow_run(args, **kwargs):
+            calls.append(args)
+            time.sleep(0.2)
+            return subprocess.CompletedProcess(args, 0, stdout='dbus.service loaded active running D-Bus\n')
+
+        monkeypatch.setattr(service_discovery, "SystemdManager", None)
+        monkeypatch.setattr(service_discovery.subprocess, "run", slow_run)
+        monkeypatch.setattr(service_discovery, "_SYSCTL_CACHE", {})
+
+        args = ('systemctl', 'list-units', '--type=service')
+        threads = [
+            threading.Thread(target=service_discovery._cached_systemctl, args=(args,))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    def test_dbus_units_skip_systemctl(self, monkeypatch):
+        """Test units are read from D-Bus without forking when pystemd is available"""
+        class FakeManager:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            class Manager:
+                @staticmethod
+                def ListUnits():
+                    return [
+                        (b'dbus.service', b'D-Bus', b'loaded', b'active', b'running', b'', b'/', 0, b'', b'/'),
+                        (b'cups.service', b'CUPS', b'loaded', b'inactive', b'dead', b'', b'/', 0, b'', b'/'),
+                        (b'-.mount', b'Root Mount', b'loaded', b'active', b'mounted', b'', b'/', 0, b'', b'/'),
+                    ]
+
+        def fail_run(args, **kwargs):
+            raise AssertionError(f"unexpected subprocess: {args}")
+
+        monkeypatch.setattr(service_discovery, "SystemdManager", FakeManager)
+        monkeypatch.setattr(service_discovery.subprocess, "run", fail_run)
+        monkeypatch.setattr(service_discovery, "_SYSCTL_CACHE", {})
+
+        active = service_discovery._cached_systemctl(
+            ('systemctl', 'list-units', '--type=service', '--state=active')
+        )
+        assert active == [('dbus.service', 'loaded', 'active', 'running', 'D-Bus')]
+        assert service_discovery._critical_statuses(
+            ['dbus.service', 'cups.service', 'gdm.service']
+        ) == ['active', 'inactive', 'inactive']
+
+    @pytest.mark.unit
+    def test_service_rows_serialize_as_objects(self, monkeypatch):
+        """Test ServiceInfo rows keep the original JSON object shape"""
+        def fake_run(args, **kwargs):
+            return subprocess.CompletedProcess(
+                args, 0, stdout='dbus.service loaded active running D-Bus System Message Bus\n'
+            )
+
+        monkeypatch.setattr(service_discovery, "SystemdManager", None)
+        monkeypatch.setattr(service_discovery.subprocess, "run", fake_run)
+        monkeypatch.setattr(service_discovery, "_SYSCTL_CACHE", {})
+
+        row = service_discovery.get_systemd_services()['services']['active'][0]
+        assert isinstance(row, service_discovery.ServiceInfo)
+        assert row._asdict() == {
+            'name': 'dbus.service',
+            'description': 'D-Bus System Message Bus',
+            'load_state': 'loaded',
+            'active_state': 'active',
+            'sub_state': 'running',
+            'category': 'System Core',
+            'educational_note': service_discovery._get_educational_note('dbus.service'),
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("service_name,expected", [
+        ("systemd-journald.service", "System Core"),
+        ("NetworkManager.service", "Network Services"),
+        ("gdm.service", "Desktop Environment"),
+        ("gnome-keyring-daemon.service", "Desktop Environment"),
+        ("cups.service", "Hardware & Drivers"),
+        ("user@1000.service", "User Services"),
+        ("docker.service", "Development Tools"),
+        ("rtkit-daemon.service", "Other"),
+        ("sshd.service", "Network Services"),
+        ("pulseaudio.service", "Hardware & Drivers"),
+        ("backups.service", "Other"),
+    ])
+    def test_categorize_service(self, service_name, expected):
+        """Test keyword-based service categorization"""
+        assert categorize_service(service_name) == expected
+
 class TestCoreModule:
     """Test core business logic - PREVIOUSLY COMPLETELY MISSING"""
     
     @pytest.mark.unit
     def test_get_status(self):
         """Test application status function"""
-        get_status = TestHelpers.import_module_function(
-            "modules.core", "get_status"
-        )
-        
         result = get_status()
         
         assert 'status' in result
@@ -214,10 +585,6 @@ class TestCoreModule:
     @pytest.mark.unit
     def test_process_data(self):
         """Test data processing function"""
-        process_data = TestHelpers.import_module_function(
-            "modules.core", "process_data"
-        )
-        
         test_data = "test input"
         result = process_data(test_data)
         
@@ -231,10 +598,6 @@ class TestCoreModule:
     @pytest.mark.unit
     def test_validate_input(self):
         """Test input validation function"""
-        validate_input = TestHelpers.import_module_function(
-            "modules.core", "validate_input"
-        )
-        
         # Test valid inputs
         assert validate_input("valid string") is True
         assert validate_input(123) is True
@@ -251,10 +614,6 @@ class TestUtilsModule:
     @pytest.mark.unit
     def test_get_timestamp(self):
         """Test timestamp generation"""
-        get_timestamp = TestHelpers.import_module_function(
-            "modules.utils", "get_timestamp"
-        )
-        
         result = get_timestamp()
         
         assert isinstance(result, str)
@@ -263,10 +622,6 @@ class TestUtilsModule:
     @pytest.mark.unit
     def test_format_response(self):
         """Test response formatting"""
-        format_response = TestHelpers.import_module_function(
-            "modules.utils", "format_response"
-        )
-        
         test_data = {"test": "data"}
         result = format_response(test_data)
         
@@ -283,10 +638,6 @@ class TestUtilsModule:
     @pytest.mark.unit
     def test_load_config(self):
         """Test configuration loading"""
-        load_config = TestHelpers.import_module_function(
-            "modules.utils", "load_config"
-        )
-        
         # Test with non-existent file (should return default)
         result = load_config("nonexistent.json")
         
@@ -296,33 +647,54 @@ class TestUtilsModule:
         assert result['service_name'] == 'homelab'
         assert result['port'] == 5000
 
-# Integration Tests - API endpoints (requires running service)
+    @pytest.mark.unit
+    def test_single_flight_coalesces_concurrent_calls(self):
+        """Test concurrent callers with the same key share one execution"""
+        import threading
+        import time
+        calls = []
+        results = []
+
+        def collect():
+            calls.append(1)
+            time.sleep(0.2)
+            return {'value': 42}
+
+        threads = [
+            threading.Thread(target=lambda: results.append(single_flight('test', collect)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{'value': 42}] * 4
+
+        # Once the call has finished, the next one runs fresh
+        single_flight('test', collect)
+        assert len(calls) == 2
+
+# Integration Tests - API endpoints (in-process live_server unless --no-service)
 class TestAPIEndpoints:
-    """Test API endpoints - requires homelab service to be running"""
+    """Test API endpoints against the in-process live_server started by conftest (skipped with --no-service)"""
     
     @pytest.mark.integration
-    def test_health_endpoint(self):
+    @pytest.mark.xdist_group(name="http")
+    def test_health_endpoint(self, api_responses):
         """Test health check endpoint"""
-        if not TestHelpers.check_service_running():
-            pytest.skip("Homelab service is not running")
-            
-        response = requests.get(f"{BASE_URL}/health", timeout=TIMEOUT)
-        
-        assert response.status_code == 200
-        data = response.json()
+        status, data = api_responses["/health"]
+        assert status == 200
         assert 'status' in data
         assert data['status'] == 'healthy'
 
     @pytest.mark.integration
-    def test_system_monitor_api(self):
+    @pytest.mark.xdist_group(name="http")
+    def test_system_monitor_api(self, overview_response):
         """Test system monitoring API endpoint"""
-        if not TestHelpers.check_service_running():
-            pytest.skip("Homelab service is not running")
-            
-        response = requests.get(f"{BASE_URL}/api/overview", timeout=TIMEOUT)
-        
-        assert response.status_code == 200
-        data = response.json()
+        status, data = overview_response
+        assert status == 200
         
         # Check the actual API structure  
         assert 'data' in data
@@ -330,20 +702,15 @@ class TestAPIEndpoints:
         
         # Essential homelab monitoring data in the data field
         monitoring_data = data['data']
-        required_fields = ['cpu', 'memory', 'disk', 'processes']
-        for field in required_fields:
-            assert field in monitoring_data
+        missing = REQUIRED_API_OVERVIEW_KEYS - monitoring_data.keys()
+        assert not missing, f"Missing monitoring fields: {sorted(missing)}"
 
     @pytest.mark.integration  
-    def test_services_api(self):
+    @pytest.mark.xdist_group(name="http")
+    def test_services_api(self, api_responses):
         """Test services discovery API endpoint"""
-        if not TestHelpers.check_service_running():
-            pytest.skip("Homelab service is not running")
-            
-        response = requests.get(f"{BASE_URL}/api/services", timeout=TIMEOUT)
-        
-        assert response.status_code == 200
-        data = response.json()
+        status, data = api_responses["/api/services"]
+        assert status == 200
         
         # Check the actual API structure
         assert 'data' in data
@@ -354,46 +721,104 @@ class TestAPIEndpoints:
         assert 'services' in services_data
         assert 'summary' in services_data
 
+# Unit Tests - HTTP layer, in-process through the Flask test client
+class TestHTTPLayer:
+    """Test routing, caching headers and imports of the app without the live service"""
+    
+    @pytest.mark.unit
+    def test_monitoring_endpoint_etag(self, monkeypatch):
+        """Test monitoring endpoints send ETags, answer 304 and never cache errors"""
+        import homelab
+        monkeypatch.setattr(homelab, "_ENDPOINT_CACHE", {})
+        client = homelab.app.test_client()
+
+        def broken_cpu_info():
+            raise RuntimeError("sensor unavailable")
+
+        monkeypatch.setattr(homelab, "get_cpu_info", broken_cpu_info)
+        response = client.get('/api/cpu')
+        assert response.status_code == 500
+        assert 'ETag' not in response.headers
+
+        monkeypatch.setattr(homelab, "get_cpu_info", lambda: {'usage_percent': 1.0})
+        response = client.get('/api/cpu')
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'].startswith('max-age=1')
+        etag = response.headers['ETag']
+
+        revalidated = client.get('/api/cpu', headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+
+    @pytest.mark.unit
+    def test_batch_endpoint_requires_testing(self, monkeypatch):
+        """Test /api/_batch is hidden outside TESTING and fans out to local routes inside it"""
+        import homelab
+        client = homelab.app.test_client()
+        
+        monkeypatch.setitem(homelab.app.config, "TESTING", False)
+        assert client.post('/api/_batch', json=['/health']).status_code == 404
+        
+        monkeypatch.setitem(homelab.app.config, "TESTING", True)
+        assert client.post('/api/_batch', json='/health').status_code == 400
+        results = client.post('/api/_batch', json=['/health', '/missing', '/api/_batch']).get_json()
+        assert results['/health']['status'] == 200
+        assert results['/health']['body']['status'] == 'healthy'
+        assert results['/missing']['status'] == 404
+        assert results['/api/_batch']['status'] == 405  # POST-only, so never recurses
+
+    @pytest.mark.unit
+    def test_import_defers_collectors(self):
+        """Test importing the app and serving /health never loads psutil"""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = (
+            "import sys, homelab\n"
+            "assert homelab.app.test_client().get('/health').status_code == 200\n"
+            "assert 'psutil' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script], cwd=project_root)
+        assert result.returncode == 0
+
 # System Tests - End-to-end functionality
 class TestSystemIntegration:
     """System-level tests for homelab functionality"""
     
     @pytest.mark.system
     @pytest.mark.slow
-    def test_dashboard_loads(self):
+    @pytest.mark.xdist_group(name="http")
+    def test_dashboard_loads(self, http, live_server, require_service):
         """Test that the main dashboard loads properly"""
-        if not TestHelpers.check_service_running():
-            pytest.skip("Homelab service is not running")
-            
-        response = requests.get(BASE_URL, timeout=TIMEOUT)
-        
-        assert response.status_code == 200
+        response = http.request("GET", live_server, timeout=TIMEOUT)
+        assert response.status == 200
         # The dashboard now returns HTML
         assert 'text/html' in response.headers.get('content-type', '')
-        assert 'Homelab Monitor' in response.text
+        assert 'Homelab Monitor' in response.data.decode()
         
     @pytest.mark.system
-    def test_dashboard_route(self):
+    @pytest.mark.xdist_group(name="http")
+    def test_dashboard_route(self, http, live_server, require_service):
         """Test the explicit dashboard route"""
-        if not TestHelpers.check_service_running():
-            pytest.skip("Homelab service is not running")
-            
-        response = requests.get(f"{BASE_URL}/dashboard", timeout=TIMEOUT)
-        
-        assert response.status_code == 200
+        response = http.request("GET", f"{live_server}/dashboard", timeout=TIMEOUT)
+        assert response.status == 200
         assert 'text/html' in response.headers.get('content-type', '')
-        assert 'System Overview' in response.text
+        assert 'System Overview' in response.data.decode()
         
     @pytest.mark.system
-    def test_dashboard_api_data_consistency(self):
+    @pytest.mark.xdist_group(name="http")
+    def test_dashboard_api_data_consistency(self, http, live_server, overview_response):
         """Test that dashboard APIs return valid data that the frontend can use"""
-        if not TestHelpers.check_service_running():
-            pytest.skip("Homelab service is not running")
+        def fetch(path):
+            response = http.request("GET", f"{live_server}{path}", timeout=TIMEOUT)
+            return response.status, _loads(response.data)
+        
+        # The dashboard loads these independently, so fetch them concurrently too
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            processes_f = executor.submit(fetch, "/api/processes")
+            critical_f = executor.submit(fetch, "/api/services/critical")
         
         # Test overview API - this is what dashboard uses
-        response = requests.get(f"{BASE_URL}/api/overview", timeout=TIMEOUT)
-        assert response.status_code == 200
-        overview_data = response.json()
+        status, overview_data = overview_response
+        assert status == 200
         
         assert overview_data["success"] is True
         data = overview_data["data"]
@@ -427,9 +852,8 @@ class TestSystemIntegration:
         assert isinstance(root_partition["usage_percent"], (int, float))
         
         # Test processes API 
-        response = requests.get(f"{BASE_URL}/api/processes", timeout=TIMEOUT)
-        assert response.status_code == 200
-        processes_data = response.json()
+        status, processes_data = processes_f.result()
+        assert status == 200
         
         assert processes_data["success"] is True
         proc_data = processes_data["data"]
@@ -448,9 +872,8 @@ class TestSystemIntegration:
             assert isinstance(proc["memory_percent"], (int, float))
         
         # Test critical services API
-        response = requests.get(f"{BASE_URL}/api/services/critical", timeout=TIMEOUT)
-        assert response.status_code == 200
-        critical_data = response.json()
+        status, critical_data = critical_f.result()
+        assert status == 200
         
         assert critical_data["success"] is True
         crit_data = critical_data["data"]
@@ -466,35 +889,34 @@ class TestSystemIntegration:
             assert service_info["is_critical"] is True
     
     @pytest.mark.system
-    def test_services_page_loads(self):
+    @pytest.mark.xdist_group(name="http")
+    def test_services_page_loads(self, http, live_server, require_service):
         """Test that the services page loads properly"""
-        if not TestHelpers.check_service_running():
-            pytest.skip("Homelab service is not running")
-            
-        response = requests.get(f"{BASE_URL}/services", timeout=TIMEOUT)
-        
-        assert response.status_code == 200
+        response = http.request("GET", f"{live_server}/services", timeout=TIMEOUT)
+        assert response.status == 200
         assert 'text/html' in response.headers.get('content-type', '')
-        assert 'System Services' in response.text
+        assert 'System Services' in response.data.decode()
 
     @pytest.mark.system
-    def test_monitoring_data_freshness(self):
+    @pytest.mark.xdist_group(name="http")
+    def test_monitoring_data_freshness(self, http, live_server, require_service):
         """Test that monitoring data is fresh and updating"""
-        if not TestHelpers.check_service_running():
-            pytest.skip("Homelab service is not running")
-            
-        # Get data twice with a small delay
         import time
-        
-        response1 = requests.get(f"{BASE_URL}/api/overview", timeout=TIMEOUT)
-        time.sleep(2)
-        response2 = requests.get(f"{BASE_URL}/api/overview", timeout=TIMEOUT)
-        
-        assert response1.status_code == 200
-        assert response2.status_code == 200
-        
-        data1 = response1.json()['data']
-        data2 = response2.json()['data']
+        url = f"{live_server}/api/overview"
+        
+        def fetch():
+            response = http.request("GET", url, timeout=TIMEOUT)
+            assert response.status == 200
+            return _loads(response.data)['data']
+        
+        data1 = fetch()
+        # The endpoint reuses one body per max-age window (plus the collector
+        # TTL), so poll on the main thread until it changes, bounded at 2.5s
+        deadline = time.monotonic() + 2.5
+        data2 = fetch()
+        while data2['timestamp'] == data1['timestamp'] and time.monotonic() < deadline:
+            time.sleep(0.05)
+            data2 = fetch()
         
         # Timestamps should be different (data is fresh)
         assert data1['timestamp'] != data2['timestamp']
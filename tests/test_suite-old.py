@@ -6,14 +6,124 @@ Template for 4-phase testing methodology
 
 import sys
 import os
+import importlib
+import reprlib
 import requests
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to the stdlib json module
+    orjson = None
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+
+@lru_cache(maxsize=None)
+def _compile_checker(sources: Tuple[str, ...]):
+    """Generate one checker function per assertion list, compiled once
+    
+    The assertions become the body of `def _check(result)`, so `result` is a
+    fast local and each call runs every check in one frame, stopping at the
+    first failing assertion.
+    """
+    body = ''.join(f"    {source}\n" for source in sources) or "    pass\n"
+    namespace = {}
+    exec(compile(f"def _check(result):\n{body}", '<assertions>', 'exec'), namespace)
+    return namespace['_check']
+
+
+def _loads(body: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed"""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize one report fragment on a single line, using orjson when it is installed"""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+# Sentinel for a contract field that is absent at some level of the path
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _field_path(field_path: str) -> Tuple[str, ...]:
+    """Split a dotted contract field ('data.status') into keys, once per field"""
+    return tuple(field_path.split('.'))
+
+
+def _lookup(data: Any, keys: Tuple[str, ...]) -> Any:
+    """Walk nested dicts by keys, returning _MISSING as soon as a level is absent"""
+    for key in keys:
+        if not isinstance(data, dict):
+            return _MISSING
+        data = data.get(key, _MISSING)
+        if data is _MISSING:
+            break
+    return data
+
+
+def _plain(value: Any) -> Any:
+    """A local result as the API would serialize it (NamedTuples become objects)"""
+    if hasattr(value, '_asdict'):
+        value = value._asdict()
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _kind(value: Any) -> str:
+    """JSON type of a value; ints and floats are both numbers"""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, (int, float)):
+        return 'number'
+    return type(value).__name__
+
+
+def _divergence(local: Any, api: Any, path: str = 'data') -> List[str]:
+    """
+    Shape and type differences between a local result and its API payload.
+    
+    Live values (usage, counts, timestamps) differ between two calls, so only
+    dict keys, JSON types and the first element of each list are compared.
+    """
+    if _kind(local) != _kind(api):
+        return [f"{path}: {_kind(local)} locally, {_kind(api)} from the API"]
+    if isinstance(local, dict):
+        mismatches = [f"{path}.{k}: missing from the API" for k in local.keys() - api.keys()]
+        mismatches += [f"{path}.{k}: missing locally" for k in api.keys() - local.keys()]
+        for k in local.keys() & api.keys():
+            mismatches += _divergence(local[k], api[k], f"{path}.{k}")
+        return mismatches
+    if isinstance(local, list) and local and api:
+        return _divergence(local[0], api[0], f"{path}[0]")
+    return []
+
+
+# Bounded repr for contract samples: large service lists are cut off while being
+# rendered instead of being fully str()-ed and then sliced
+_SAMPLE_REPR = reprlib.Repr()
+_SAMPLE_REPR.maxlist = _SAMPLE_REPR.maxdict = 2
+_SAMPLE_REPR.maxstring = _SAMPLE_REPR.maxother = 50
+
+
+def _sample(value: Any) -> str:
+    """Short debugging preview of one response field"""
+    return value[:50] if isinstance(value, str) else _SAMPLE_REPR.repr(value)[:50]
+
+
 class TestSuite:
     """
     Comprehensive testing suite template following 4-phase methodology:
@@ -26,8 +136,31 @@ class TestSuite:
     are automatically excluded from mandatory testing requirements.
     """
     
-    def __init__(self, base_url: str = "http://localhost:5000"):
+    def __init__(self, base_url: Optional[str] = "http://localhost:5000",
+                 reuse_api: bool = False, strict: bool = False):
         self.base_url = base_url
+        # reuse_api: check phase 1 against each function's API payload (read once,
+        # shared with phase 2) instead of calling it again locally.
+        # strict: with reuse_api, also call the functions locally and fail any
+        # test whose local result diverges from the API payload
+        self.reuse_api = reuse_api
+        self.strict = strict
+        # No base_url: dispatch requests to the Flask app in-process, without sockets
+        self._client = None
+        if not base_url:
+            from homelab import app
+            self._client = app.test_client()
+        # Whether the server offers POST /api/_batch; unknown until the first try,
+        # so a normal (non-TESTING) server costs one 404 per run, not one per phase
+        self._batch_supported: Optional[bool] = None if base_url else False
+        # One keep-alive pool shared by every phase, sized for the parallel API probes
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        # Backend results keyed by (module, function): each collector runs once per suite
+        self._backend_results: Dict[Tuple[str, str], Any] = {}
+        # (status, JSON body) per API path: each endpoint is read once for phases 2 and 2.5
+        self._endpoint_cache: Dict[str, Tuple[int, Any]] = {}
         self.results = {
             "phase_1_backend": {},
             "phase_2_api": {},
@@ -36,11 +169,12 @@ class TestSuite:
             "summary": {"total_tests": 0, "passed": 0, "failed": 0, "errors": []}
         }
     
+    # Log level prefixes
+    _ICON = {"TEST": "🧪", "INFO": "ℹ️", "PASS": "✅", "FAIL": "❌", "WARN": "⚠️"}
+    
     def log(self, message: str, level: str = "INFO"):
         """Log test message with timestamp"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        icon = {"TEST": "🧪", "INFO": "ℹ️", "PASS": "✅", "FAIL": "❌", "WARN": "⚠️"}
-        print(f"{icon.get(level, 'ℹ️')} [{timestamp}] {message}")
+        print(f"{self._ICON.get(level, 'ℹ️')} [{time.strftime('%H:%M:%S')}] {message}")
     
     def phase_1_backend_tests(self):
         """Phase 1: Test all backend functions directly"""
@@ -53,6 +187,8 @@ class TestSuite:
                 "description": "Test CPU information retrieval",
                 "module": "modules.system_monitor",
                 "function": "get_cpu_info",
+                "api_equiv": "/api/cpu",
+                "stable_fields": ["cores"],
                 "assertions": [
                     "assert 'usage_percent' in result",
                     "assert isinstance(result['usage_percent'], (int, float))",
@@ -67,6 +203,8 @@ class TestSuite:
                 "description": "Test memory information retrieval",
                 "module": "modules.system_monitor",
                 "function": "get_memory_info",
+                "api_equiv": "/api/memory",
+                "stable_fields": ["total_gb", "swap.total_gb"],
                 "assertions": [
                     "assert 'total_gb' in result",
                     "assert 'used_gb' in result",
@@ -83,6 +221,7 @@ class TestSuite:
                 "description": "Test disk information retrieval",
                 "module": "modules.system_monitor",
                 "function": "get_disk_info",
+                "api_equiv": "/api/disk",
                 "assertions": [
                     "assert 'partitions' in result",
                     "assert isinstance(result['partitions'], dict)",
@@ -94,6 +233,7 @@ class TestSuite:
                 "description": "Test top processes retrieval",
                 "module": "modules.system_monitor",
                 "function": "get_top_processes",
+                "api_equiv": "/api/processes",
                 "assertions": [
                     "assert 'top_cpu' in result",
                     "assert 'top_memory' in result",
@@ -108,6 +248,8 @@ class TestSuite:
                 "description": "Test comprehensive system overview",
                 "module": "modules.system_monitor",
                 "function": "get_system_overview",
+                "api_equiv": "/api/overview",
+                "stable_fields": ["hostname", "boot_time"],
                 "assertions": [
                     "assert 'cpu' in result",
                     "assert 'memory' in result",
@@ -122,6 +264,8 @@ class TestSuite:
                 "description": "Test educational context provider",
                 "module": "modules.system_monitor",
                 "function": "get_educational_context",
+                "api_equiv": "/api/education",
+                "stable_fields": ["cpu_usage", "memory_usage", "disk_usage", "processes", "monitoring_importance"],
                 "assertions": [
                     "assert 'cpu_usage' in result",
                     "assert 'memory_usage' in result",
@@ -136,6 +280,7 @@ class TestSuite:
                 "description": "Test systemd services discovery",
                 "module": "modules.service_discovery",
                 "function": "get_systemd_services",
+                "api_equiv": "/api/services",
                 "assertions": [
                     "assert 'services' in result",
                     "assert 'summary' in result",
@@ -152,6 +297,8 @@ class TestSuite:
                 "description": "Test service categorization",
                 "module": "modules.service_discovery",
                 "function": "get_service_categories",
+                "api_equiv": "/api/services/categories",
+                "stable_fields": ["category_descriptions"],
                 "assertions": [
                     "assert 'categories' in result",
                     "assert 'category_descriptions' in result",
@@ -166,6 +313,8 @@ class TestSuite:
                 "description": "Test critical services monitoring",
                 "module": "modules.service_discovery",
                 "function": "get_critical_services",
+                "api_equiv": "/api/services/critical",
+                "stable_fields": ["educational_context"],
                 "assertions": [
                     "assert 'critical_services' in result",
                     "assert 'educational_context' in result",
@@ -176,18 +325,35 @@ class TestSuite:
             }
         }
         
+        run_local = not self.reuse_api or self.strict
+        if run_local:
+            # Import every backend function before the loop; a missing module shows up front
+            functions = self._resolve_backend(backend_tests.values())
+            self._prefetch_backend(functions)
+        if self.reuse_api:
+            self._prefetch_endpoints([test_config['api_equiv'] for test_config in backend_tests.values()])
+        
         for test_name, test_config in backend_tests.items():
             self.log(f"Testing {test_config['description']}...")
             
             try:
-                # Dynamic import and execution
-                module = __import__(test_config['module'], fromlist=[test_config['function']])
-                func = getattr(module, test_config['function'])
-                result = func()
+                results = []
+                if self.reuse_api:
+                    results.append(self._api_data(test_config['api_equiv']))
+                if run_local:
+                    key = (test_config['module'], test_config['function'])
+                    results.append(self._backend_result(key, functions[key]))
                 
                 # Run assertions
-                for assertion in test_config['assertions']:
-                    exec(assertion)
+                check = _compile_checker(tuple(test_config['assertions']))
+                for result in results:
+                    check(result)
+                
+                # strict: the API must serve what the function returns locally
+                if self.reuse_api and self.strict:
+                    mismatches = self._compare_local_api(test_config, *results)
+                    if mismatches:
+                        raise Exception(f"Local/API divergence: {mismatches[:5]}")
                 
                 self.results["phase_1_backend"][test_name] = {
                     "success": True,
@@ -204,6 +370,57 @@ class TestSuite:
                 }
                 self.log(f"❌ {test_name}: FAILED - {e}", "FAIL")
     
+    def _compare_local_api(self, test_config: Dict[str, Any], api: Any, local: Any) -> List[str]:
+        """Shape/type differences plus any stable_fields whose values differ"""
+        local = _plain(local)
+        mismatches = _divergence(local, api)
+        for field_path in test_config.get('stable_fields', ()):
+            keys = _field_path(field_path)
+            if _lookup(local, keys) != _lookup(api, keys):
+                mismatches.append(f"data.{field_path}: value differs from the API")
+        return mismatches
+    
+    def _resolve_backend(self, test_configs) -> Dict[Tuple[str, str], Any]:
+        """Map each (module, function) to its callable, or to the error that stopped its import"""
+        functions = {}
+        for test_config in test_configs:
+            key = (test_config['module'], test_config['function'])
+            if key in functions:
+                continue
+            try:
+                functions[key] = getattr(importlib.import_module(key[0]), key[1])
+            except (ImportError, AttributeError) as e:
+                functions[key] = e
+                self.log(f"{key[0]}.{key[1]} unavailable: {e}", "WARN")
+        return functions
+    
+    def _prefetch_backend(self, functions: Dict[Tuple[str, str], Any]) -> None:
+        """Call the distinct backend functions concurrently and memoise their results
+        
+        psutil syscalls, the CPU sample wait and the systemctl subprocess all
+        release the GIL, so phase 1 takes about as long as its slowest call.
+        A function that raises is replaced by its error in functions.
+        """
+        pending = {
+            key: function for key, function in functions.items()
+            if callable(function) and key not in self._backend_results
+        }
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {key: executor.submit(function) for key, function in pending.items()}
+        for key, future in futures.items():
+            try:
+                self._backend_results[key] = future.result()
+            except Exception as e:
+                functions[key] = e
+    
+    def _backend_result(self, key: Tuple[str, str], function: Any) -> Any:
+        """Call a resolved backend function once, reusing its result for later checks"""
+        if isinstance(function, Exception):
+            raise function
+        if key not in self._backend_results:
+            self._backend_results[key] = function()
+        return self._backend_results[key]
+    
     def phase_2_api_tests(self):
         """Phase 2: Test all API endpoints"""
         self.log("\n🌐 PHASE 2: API INTEGRATION TESTING", "TEST")
@@ -241,42 +458,84 @@ class TestSuite:
             }
         }
         
-        for test_name, test_config in api_tests.items():
+        for test_config in api_tests.values():
+            # Built once so each response check is a single set difference
+            test_config['fields_fs'] = frozenset(test_config['expected_fields'])
             self.log(f"Testing {test_config['endpoint']}...")
+        
+        # Read every endpoint up front (skipping any phase 1 already fetched),
+        # then check the cached responses
+        self._prefetch_endpoints([test_config['endpoint'] for test_config in api_tests.values()])
+        outcomes = {}
+        for test_name, test_config in api_tests.items():
+            outcomes[test_name] = self._probe(test_name, test_config)
+            self._log_outcome(outcomes[test_name])
+        
+        # Record in declaration order so the saved report stays stable
+        for test_name in api_tests:
+            self.results["phase_2_api"][test_name] = outcomes[test_name]
+    
+    def _log_outcome(self, outcome: Dict[str, Any]):
+        """Log one phase 2 endpoint result"""
+        if outcome["success"]:
+            self.log(f"✅ {outcome['endpoint']}: PASSED", "PASS")
+        else:
+            self.log(f"❌ {outcome['endpoint']}: FAILED - {outcome['error']}", "FAIL")
+    
+    def _batch_fetch(self, paths: List[str]) -> Optional[Dict[str, Tuple[int, Any]]]:
+        """GET all paths through POST /api/_batch; None when the route is disabled or fails"""
+        if self._batch_supported is False:
+            return None
+        try:
+            response = self.session.post(f"{self.base_url}/api/_batch", json=paths, timeout=30)
+            if response.status_code == 200:
+                results = _loads(response.content)
+                batched = {path: (results[path]["status"], results[path]["body"]) for path in paths}
+                self._batch_supported = True
+                return batched
+        except (requests.RequestException, ValueError, KeyError, TypeError):
+            pass
+        self._batch_supported = False
+        return None
+    
+    def _probe(self, test_name: str, test_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one API endpoint and check its expected top-level fields"""
+        try:
+            status, data = self._fetch(test_config['endpoint'])
+            return self._check_response(test_config, status, data)
+        except Exception as e:
+            return {
+                "success": False,
+                "endpoint": test_config['endpoint'],
+                "error": str(e)
+            }
+    
+    def _check_response(self, test_config: Dict[str, Any], status: int, data: Any) -> Dict[str, Any]:
+        """Turn an endpoint's status and JSON body into a phase 2 result"""
+        try:
+            if status != 200:
+                raise Exception(f"HTTP {status}")
             
-            try:
-                response = requests.get(f"{self.base_url}{test_config['endpoint']}", timeout=10)
-                
-                if response.status_code != 200:
-                    raise Exception(f"HTTP {response.status_code}")
-                
-                data = response.json()
-                
-                # Check expected fields
-                missing_fields = []
-                for field in test_config['expected_fields']:
-                    if field not in data:
-                        missing_fields.append(field)
-                
-                if missing_fields:
-                    raise Exception(f"Missing fields: {missing_fields}")
-                
-                self.results["phase_2_api"][test_name] = {
-                    "success": True,
-                    "endpoint": test_config['endpoint'],
-                    "expected_fields": test_config['expected_fields'],
-                    "missing_fields": [],
-                    "details": f"✅ All {len(test_config['expected_fields'])} fields present"
-                }
-                self.log(f"✅ {test_config['endpoint']}: PASSED", "PASS")
-                
-            except Exception as e:
-                self.results["phase_2_api"][test_name] = {
-                    "success": False,
-                    "endpoint": test_config['endpoint'],
-                    "error": str(e)
-                }
-                self.log(f"❌ {test_config['endpoint']}: FAILED - {e}", "FAIL")
+            # Check expected fields, reported in declaration order
+            missing = test_config['fields_fs'] - data.keys()
+            if missing:
+                missing_fields = [field for field in test_config['expected_fields'] if field in missing]
+                raise Exception(f"Missing fields: {missing_fields}")
+            
+            return {
+                "success": True,
+                "endpoint": test_config['endpoint'],
+                "expected_fields": test_config['expected_fields'],
+                "missing_fields": [],
+                "details": f"✅ All {len(test_config['expected_fields'])} fields present"
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "endpoint": test_config['endpoint'],
+                "error": str(e)
+            }
     
     def phase_2_5_contract_validation(self):
         """Phase 2.5: Validate API-Frontend data contracts"""
@@ -301,31 +560,24 @@ class TestSuite:
             self.log(f"Validating {test_config['api_endpoint']} contract...")
             
             try:
-                response = requests.get(f"{self.base_url}{test_config['api_endpoint']}", timeout=10)
-                data = response.json()
+                status, data = self._fetch(test_config['api_endpoint'])
                 
                 # Validate structure
                 missing_fields = []
                 for field_path, expected_type in test_config['expected_structure'].items():
                     # Simple field validation - extend as needed
-                    if '.' in field_path:
-                        parts = field_path.split('.')
-                        current = data
-                        for part in parts:
-                            if part not in current:
-                                missing_fields.append(field_path)
-                                break
-                            current = current[part]
-                    else:
-                        if field_path not in data:
-                            missing_fields.append(field_path)
+                    if _lookup(data, _field_path(field_path)) is _MISSING:
+                        missing_fields.append(field_path)
                 
-                self.results["phase_2_5_contracts"][test_name] = {
+                result = {
                     "success": len(missing_fields) == 0,
                     "api_endpoint": test_config['api_endpoint'],
-                    "missing_fields": missing_fields,
-                    "sample_data": {k: str(v)[:50] for k, v in data.items() if k != 'error'}
+                    "missing_fields": missing_fields
                 }
+                # Sample the payload only when there is a failure to debug
+                if missing_fields:
+                    result["sample_data"] = {k: _sample(v) for k, v in data.items() if k != 'error'}
+                self.results["phase_2_5_contracts"][test_name] = result
                 
                 if missing_fields:
                     self.log(f"❌ {test_name}: CONTRACT INVALID - Missing: {missing_fields}", "FAIL")
@@ -339,6 +591,52 @@ class TestSuite:
                 }
                 self.log(f"❌ {test_name}: CONTRACT ERROR - {e}", "FAIL")
     
+    def _fetch(self, path: str) -> Tuple[int, Any]:
+        """(status, JSON body or None) for path, requested at most once per run"""
+        if path not in self._endpoint_cache:
+            status, body = self._get(path)
+            try:
+                data = _loads(body)
+            except ValueError:
+                data = None
+            self._endpoint_cache[path] = (status, data)
+        return self._endpoint_cache[path]
+    
+    def _prefetch_endpoints(self, paths: List[str]) -> None:
+        """Fill the endpoint cache for the paths not read yet
+        
+        One round trip when the server exposes the test-only batch route,
+        otherwise the independent endpoints are read at once over the shared
+        pool (or one by one in-process, where there is no wait to overlap).
+        """
+        paths = [path for path in paths if path not in self._endpoint_cache]
+        if not paths:
+            return
+        batched = self._batch_fetch(paths)
+        if batched is not None:
+            self._endpoint_cache.update(batched)
+        elif self._client is not None:
+            for path in paths:
+                self._fetch(path)
+        else:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(self._fetch, paths))
+    
+    def _api_data(self, path: str) -> Any:
+        """The 'data' payload of a successful API response, for reuse_api checks"""
+        status, body = self._fetch(path)
+        if status != 200 or not isinstance(body, dict) or not body.get('success'):
+            raise Exception(f"{path}: HTTP {status}")
+        return body['data']
+    
+    def _get(self, path: str) -> Tuple[int, bytes]:
+        """GET path as (status, body), in-process when there is no base_url"""
+        if self._client is not None:
+            response = self._client.get(path)
+            return response.status_code, response.data
+        response = self.session.get(f"{self.base_url}{path}", timeout=10)
+        return response.status_code, response.content
+    
     def phase_3_frontend_tests(self):
         """Phase 3: Test frontend functionality"""
         self.log("\n🖥️ PHASE 3: FRONTEND INTEGRATION TESTING", "TEST")
@@ -378,42 +676,35 @@ class TestSuite:
     def _test_page_load(self) -> Tuple[bool, str]:
         """Test main page loading"""
         try:
-            response = requests.get(self.base_url, timeout=10)
-            if response.status_code == 200:
+            status, _ = self._get('/')
+            if status == 200:
                 return True, "Main page loaded successfully"
             else:
-                return False, f"HTTP {response.status_code}"
+                return False, f"HTTP {status}"
         except Exception as e:
             return False, str(e)
     
     def generate_summary(self):
-        """Generate test summary"""
-        total_tests = 0
-        passed_tests = 0
-        failed_tests = 0
-        errors = []
-        
-        for phase, tests in self.results.items():
-            if phase == "summary":
-                continue
-                
-            for test_name, result in tests.items():
-                total_tests += 1
-                if result.get("success", False):
-                    passed_tests += 1
-                else:
-                    failed_tests += 1
-                    error_msg = result.get("error", "Unknown error")
-                    errors.append(f"{phase}.{test_name}: {error_msg}")
-        
-        self.results["summary"] = {
-            "total_tests": total_tests,
-            "passed": passed_tests,
-            "failed": failed_tests,
-            "errors": errors
-        }
+        """Generate test summary from the counts kept by _record_phase"""
+        summary = self.results["summary"]
+        return summary["total_tests"], summary["passed"], summary["failed"]
+    
+    def _record_phase(self, phase: str, report) -> None:
+        """Count a finished phase, append it to the report as one line and release it"""
+        tests = self.results[phase]
+        summary = self.results["summary"]
+        for test_name, result in tests.items():
+            summary["total_tests"] += 1
+            if result.get("success", False):
+                summary["passed"] += 1
+            else:
+                summary["failed"] += 1
+                error_msg = result.get("error", "Unknown error")
+                summary["errors"].append(f"{phase}.{test_name}: {error_msg}")
         
-        return total_tests, passed_tests, failed_tests
+        report.write(_dumps(phase) + b': ' + _dumps(tests) + b',\n')
+        report.flush()
+        tests.clear()
     
     def run_all_tests(self):
         """Run complete test suite"""
@@ -422,14 +713,27 @@ class TestSuite:
         self.log(f"Target: {self.base_url}")
         self.log(f"Started: {datetime.now().isoformat()}")
         self.log("")
+        self._endpoint_cache.clear()
         
-        # Run all phases
-        self.phase_1_backend_tests()
-        self.phase_2_api_tests()
-        self.phase_2_5_contract_validation()
-        self.phase_3_frontend_tests()
+        # Stream results to the report as each phase finishes, so progress can be
+        # tailed and finished phases are not held until the end
+        timestamp = int(time.time())
+        results_file = f"test-results/test_results_{timestamp}.json"
+        os.makedirs("test-results", exist_ok=True)
+        
+        phases = (
+            ("phase_1_backend", self.phase_1_backend_tests),
+            ("phase_2_api", self.phase_2_api_tests),
+            ("phase_2_5_contracts", self.phase_2_5_contract_validation),
+            ("phase_3_frontend", self.phase_3_frontend_tests),
+        )
+        with open(results_file, 'wb') as report:
+            report.write(b'{\n')
+            for phase, run_phase in phases:
+                run_phase()
+                self._record_phase(phase, report)
+            report.write(b'"summary": ' + _dumps(self.results["summary"]) + b'}\n')
         
-        # Generate summary
         total, passed, failed = self.generate_summary()
         
         self.log("\n📊 FINAL TEST REPORT", "TEST")
@@ -438,15 +742,6 @@ class TestSuite:
         self.log(f"Passed: {passed}", "PASS")
         self.log(f"Failed: {failed}", "FAIL" if failed > 0 else "PASS")
         self.log("")
-        
-        # Save results
-        timestamp = int(datetime.now().timestamp())
-        results_file = f"test-results/test_results_{timestamp}.json"
-        os.makedirs("test-results", exist_ok=True)
-        
-        with open(results_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
-        
         self.log(f"📄 Detailed report saved: {os.path.abspath(results_file)}")
         self.log(f"🎯 Success Rate: {(passed/total)*100:.1f}%")
         
@@ -458,8 +753,16 @@ class TestSuite:
             return False
 
 def main():
-    """Main test runner"""
-    suite = TestSuite()
+    """Main test runner
+    
+    --in-process  test the app without starting a server
+    --reuse-api   check phase 1 against the API payloads instead of calling the functions
+    --strict      with --reuse-api, also call the functions locally and fail on
+                  any local-vs-API divergence (shape, types, stable_fields)
+    """
+    args = sys.argv[1:]
+    base_url = None if "--in-process" in args else "http://localhost:5000"
+    suite = TestSuite(base_url, reuse_api="--reuse-api" in args, strict="--strict" in args)
     success = suite.run_all_tests()
     sys.exit(0 if success else 1)
 